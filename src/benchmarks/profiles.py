@@ -0,0 +1,92 @@
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from src.engines.profile_manager import ProfileManager
+
+# RUN "python -m src.benchmarks.profiles [players]" to compare the SQLite profile store with the
+#     old whole-file profiles.json (parse everything at launch, rewrite everything on save),
+#     then to check that cabinets sharing the database don't lose each other's points
+
+
+def timed(function, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(players=50000, saves=20):
+    profiles = {f"player{i}": {"score": i * 7 % 10007} for i in range(players)}
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "profiles.json")
+        with open(json_path, "w") as file:
+            json.dump(profiles, file, indent=4)
+
+        # The old store: json.load at launch, json.dump of everything after each match
+        def json_launch():
+            with open(json_path) as file:
+                return json.load(file)
+
+        def json_save():
+            loaded["player1"]["score"] += 1
+            with open(json_path, "w") as file:
+                json.dump(loaded, file, indent=4)
+
+        loaded = json_launch()
+        print(f"{players} players")
+        print(f"json    launch {timed(json_launch):8.2f} ms   save {timed(json_save, saves):8.2f} ms")
+
+        manager = ProfileManager(os.path.join(directory, "profiles.db"), json_path)
+        migrate = timed(lambda: manager.get_profile("player1"))
+        manager.close()
+
+        def sqlite_launch():
+            fresh = ProfileManager(os.path.join(directory, "profiles.db"), json_path)
+            fresh.get_profile("player1")
+            fresh.close()
+
+        def sqlite_save():
+            manager.update_profile_score("player1", manager.get_profile("player1")["score"] + 1)
+            manager.save_profiles()
+
+        launch = timed(sqlite_launch, saves)
+        save = timed(sqlite_save, saves)
+        top = timed(lambda: manager.top_scores(10), saves)
+        print(f"sqlite  launch {launch:8.2f} ms   save {save:8.2f} ms   top 10 {top:.2f} ms"
+              f"   (one-time import {migrate:.0f} ms)")
+        manager.close()
+
+        concurrent(os.path.join(directory, "profiles.db"))
+
+
+def cabinet(filename, updates):
+    """One arcade process: logs a player in once, then saves after every match, each worth a point."""
+    manager = ProfileManager(filename, None)
+    score = manager.get_profile("shared")["score"]
+    for _ in range(updates):
+        score = manager.update_profile_score("shared", score + 1)
+    manager.close()
+
+
+def concurrent(filename, cabinets=4, updates=200):
+    manager = ProfileManager(filename, None)
+    before = manager.get_profile("shared")["score"]
+    start = time.perf_counter()
+    workers = [multiprocessing.Process(target=cabinet, args=(filename, updates)) for _ in range(cabinets)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    gained = manager.get_profile("shared")["score"] - before
+    manager.close()
+    print(f"{cabinets} cabinets x {updates} saves of one player: {cabinets * updates / elapsed:.0f} saves/s, "
+          f"{cabinets * updates - gained} points lost")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
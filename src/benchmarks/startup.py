@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import time
+
+# RUN "python -m src.benchmarks.startup" to measure time from launch to the first (splash) frame
+#     and to the main menu once the warm-up is done
+#     ("--window" uses the real display instead of SDL's dummy driver)
+
+
+def child():
+    """Runs in a fresh interpreter: builds the arcade and reports how long each startup stage took."""
+    launched = float(os.environ["STARTUP_LAUNCHED"])
+    from src.main import create_arcade
+    from src.engines.game_registry import GAMES
+    from src.engines.player import Player
+    screen_manager = create_arcade()
+    splash = screen_manager.current_screen
+    splash.render()
+    print(f"first_frame {(time.time() - launched) * 1000:.1f}")
+
+    splash.warmup.wait()
+    splash.update(0)  # Switches to the main menu
+    screen_manager.current_screen.render()
+    print(f"menu_ready {(time.time() - launched) * 1000:.1f}")
+    for label, seconds in splash.warmup.timings:
+        print(f"warm_{label.replace(' ', '_')} {seconds * 1000:.1f}")
+
+    # What picking each game for the first time still costs: building it and its first frame
+    for name, entry in GAMES.items():
+        start = time.perf_counter()
+        game = entry.load()(Player("a"), Player("b"))
+        game.render(screen_manager.ensure_display(game.display_size))
+        game.close()
+        print(f"start_{name} {(time.perf_counter() - start) * 1000:.1f}")
+
+
+def main(runs=10, window=False):
+    env = dict(os.environ)
+    if not window:
+        env["SDL_VIDEODRIVER"] = env["SDL_AUDIODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    results = {}
+    for _ in range(runs):
+        env["STARTUP_LAUNCHED"] = repr(time.time())
+        output = subprocess.run([sys.executable, "-m", "src.benchmarks.startup", "--child"], env=env,
+                                capture_output=True, text=True, check=True).stdout
+        for line in output.splitlines():
+            key, _, value = line.partition(" ")
+            try:
+                value = float(value)
+            except ValueError:
+                continue  # Prints from the game code
+            results.setdefault(key, []).append(value)
+    for key, times in results.items():
+        times.sort()
+        print(f"{key:<20} median {times[len(times) // 2]:7.1f} ms   min {times[0]:7.1f} ms   ({runs} runs)")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        main(window="--window" in sys.argv)
@@ -0,0 +1,104 @@
+import contextlib
+import os
+import sys
+import time
+import numpy as np
+import pygame
+
+from src.engines.player import Player
+from src.games.suika import SuikaGame, PreParticle, PHYSICS_PROFILES, PAD, WIDTH
+
+# RUN "python -m src.benchmarks.suika_physics [profile...]" to compare physics profiles
+
+
+def max_overlap(game):
+    """Deepest overlap (px) between two fruit on the same board; a measure of solver quality."""
+    table = game.table
+    slots = table.live_slots()
+    pos, radius, owner = table.pos[slots], table.radius[slots], table.owner[slots]
+    gap = np.linalg.norm(pos[:, None] - pos[None], axis=2) - (radius[:, None] + radius[None])
+    same = (owner[:, None] == owner[None]) & ~np.eye(len(slots), dtype=bool)
+    return max(0.0, float(-gap[same].min())) if same.any() else 0.0
+
+
+def timed_steps(board, totals):
+    """Wraps a board's step so the time spent inside pymunk is added to totals[0]."""
+    step = board.step
+
+    def timed(dt):
+        start = time.perf_counter()
+        step(dt)
+        totals[0] += time.perf_counter() - start
+    board.step = timed
+
+
+def run(profile, seconds=120, drop_every=1.0, seed=0):
+    """Plays a scripted two-player match on one profile.
+
+    Returns (ms per frame, ms of it inside space.step, live fruit, max overlap, scores),
+    the first two measured over the second half, once the jars have filled up.
+    """
+    game = SuikaGame(Player("a"), Player("b"), seed=seed, headless=True,
+                     parallel=False, physics_profile=profile)
+    solver = [0.0]
+    for board in game.boards:
+        timed_steps(board, solver)
+    rng = np.random.default_rng(seed)
+    game.frame_ms = round(1000 / 60)
+    frames = int(seconds * 60)
+    drop_frames = int(drop_every * 60)
+    for frame in range(frames):
+        if frame == frames // 2:
+            start, solver[0] = time.perf_counter(), 0.0
+        if frame % drop_frames == 0:
+            x = rng.integers(0, 2 * WIDTH)
+            game.handle_player_input(pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 0)))
+            game.handle_player_input(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(x, 0)))
+        game.update_board()
+    measured = frames - frames // 2
+    elapsed = time.perf_counter() - start
+    game.close()
+    return (elapsed * 1000 / measured, solver[0] * 1000 / measured,
+            game.table.count(), max_overlap(game), game.get_scores())
+
+
+def pile(profile, n_fruit=60, settle=3, seconds=6, seed=1):
+    """Drops the same n_fruit into both jars, lets them settle, then times a pile at rest.
+
+    Returns (ms per frame, ms of it inside space.step, live fruit, max overlap).
+    """
+    game = SuikaGame(Player("a"), Player("b"), seed=seed, headless=True,
+                     parallel=False, physics_profile=profile)
+    solver = [0.0]
+    rng = np.random.default_rng(seed)
+    for board in game.boards:
+        timed_steps(board, solver)
+        for i in range(n_fruit):
+            pre_particle = PreParticle(board.offset + 60 + rng.random() * 450, i % 6)
+            # Stack them in a column above the jar so they land one after another
+            board.drop(pre_particle).body.position = (pre_particle.x, PAD[1] + 600 - 40 * i)
+    game.frame_ms = round(1000 / 60)
+    for _ in range(settle * 60):
+        game.update_board()
+    start, solver[0] = time.perf_counter(), 0.0
+    for _ in range(seconds * 60):
+        game.update_board()
+    elapsed = time.perf_counter() - start
+    game.close()
+    return elapsed * 1000 / (seconds * 60), solver[0] * 1000 / (seconds * 60), game.table.count(), max_overlap(game)
+
+
+def main(profiles):
+    for profile in profiles or PHYSICS_PROFILES:
+        # The game's debug prints would dominate the timings
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            frame_ms, solver_ms, live, overlap, scores = run(profile)
+            pile_ms, pile_solver_ms, pile_live, pile_overlap = pile(profile)
+        print(f"{profile:>9} match: {frame_ms:.3f} ms/frame, {solver_ms:.3f} ms in space.step | "
+              f"{live} fruit, max overlap {overlap:.1f}px, scores {scores}")
+        print(f"{profile:>9}  pile: {pile_ms:.3f} ms/frame, {pile_solver_ms:.3f} ms in space.step | "
+              f"{pile_live} fruit at rest, max overlap {pile_overlap:.1f}px")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
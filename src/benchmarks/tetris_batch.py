@@ -0,0 +1,65 @@
+import time
+import numpy as np
+
+from src.engines.player import Player
+from src.games.tetris import TetrisGame
+from src.games.tetris_batch import TetrisBatch, MIN_X, MAX_X, SHAPE_NAMES
+from src.games.tetris_bot import TetrisBot
+
+# RUN "python -m src.benchmarks.tetris_batch" to measure batch placement throughput
+#     (after checking that the batch scores placements exactly like TetrisGame)
+
+
+def check_against_game(placements=2000, seed=0):
+    """Plays the same hard drops in a one-game TetrisBatch and a headless TetrisGame; scores must match.
+
+    A TetrisBot picks most placements so that lines (including multi-line clears) actually get cleared.
+    """
+    bot = TetrisBot(lookahead=False)
+    batch = TetrisBatch(1, seed=seed)
+    game = TetrisGame(Player("batch"), Player("unused"), seed=seed, headless=True)
+    rng = np.random.default_rng(seed)
+    lines = 0
+    for _ in range(placements):
+        shape = int(batch.pieces[0])
+        piece = game.active_piece1
+        piece.shape, piece.rotation = SHAPE_NAMES[shape], 0
+        placement = bot.choose_placement(batch.boards[0], piece) if rng.random() < 0.9 else None
+        if placement is None:
+            rotation = int(rng.integers(0, 4))
+            placement = rotation, int(rng.integers(MIN_X[shape, rotation], MAX_X[shape, rotation] + 1))
+        rotation, x = placement
+
+        cleared, _, done = batch.step(np.array([rotation]), np.array([x]))
+        lines += int(cleared[0])
+        # Same piece, dropped straight down from above the board like the batch does
+        piece.rotation, piece.x, piece.y = rotation, x, -4
+        piece.y = game.ghost_y(piece, game.board1, player=1)
+        if piece.y + min(dy for _, dy in piece.blocks) >= 0:
+            game.lock_piece(piece, game.board1, player=1)
+        assert game.player1.score == batch.scores[0], (game.player1.score, int(batch.scores[0]))
+        if done[0]:
+            batch.reset()
+            game = TetrisGame(Player("batch"), Player("unused"), seed=seed, headless=True)
+    print(f"TetrisGame and TetrisBatch scored {placements} placements ({lines} lines cleared) the same")
+
+
+def main(n_games=4096, steps=500, seed=0):
+    check_against_game(seed=seed)
+    batch = TetrisBatch(n_games, seed=seed)
+    rng = np.random.default_rng(seed)
+    placements = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        rotations = rng.integers(0, 4, n_games)
+        xs = rng.integers(MIN_X.min(), MAX_X.max() + 1, n_games)
+        placements += int((~batch.done).sum())
+        _, _, done = batch.step(rotations, xs)
+        batch.reset(done)
+    elapsed = time.perf_counter() - start
+    print(f"{placements} placements in {elapsed:.2f}s "
+          f"({placements / elapsed * 60 / 1e6:.1f}M placements/minute, {n_games} games)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import pygame
+
+
+class DirtyRegions:
+    """Collects the screen rects changed during a frame and pushes only those to the display."""
+
+    def __init__(self, full_threshold=0.5):
+        """
+        full_threshold: fraction of the window; when the merged dirty area is
+        larger than this, a full flip is cheaper than a list of updates.
+        """
+        self.full_threshold = full_threshold
+        self.rects = []
+        self.full = False
+
+    def add(self, rect):
+        """Marks a rect (or anything pygame.Rect accepts) as changed."""
+        if not self.full:
+            self.rects.append(pygame.Rect(rect))
+
+    def add_all(self):
+        """Marks the whole window as changed."""
+        self.full = True
+        self.rects = []
+
+    def merged(self):
+        """Returns the dirty rects with overlapping or touching ones combined."""
+        merged = []
+        for rect in sorted(self.rects, key=lambda r: (r.x, r.y)):
+            if rect.w <= 0 or rect.h <= 0:
+                continue
+            grown = rect.inflate(2, 2)
+            i = 0
+            while i < len(merged):
+                if grown.colliderect(merged[i]):
+                    rect = rect.union(merged.pop(i))
+                    grown = rect.inflate(2, 2)
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        """Updates the display with this frame's changes and starts a new frame."""
+        surface = pygame.display.get_surface()
+        if surface is not None and (self.full or self.rects):
+            if self.full:
+                pygame.display.flip()
+            else:
+                screen_rect = surface.get_rect()
+                rects = [r.clip(screen_rect) for r in self.merged()]
+                area = sum(r.w * r.h for r in rects)
+                if area > self.full_threshold * screen_rect.w * screen_rect.h:
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
+        self.rects = []
+        self.full = False
@@ -0,0 +1,111 @@
+import time
+import numpy as np
+import pygame
+from src.engines.resource_cache import get_sysfont, render_text
+
+# Phases of one Game.run_game_loop frame, in order
+PHASES = ("events", "input", "update", "game_over", "render", "present", "wait")
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples."""
+
+    def __init__(self, size):
+        self.data = np.zeros(size)
+        self.index = 0
+        self.count = 0
+
+    def add(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+
+    def values(self):
+        """Samples oldest first."""
+        if self.count < len(self.data):
+            return self.data[:self.count].copy()
+        return np.roll(self.data, -self.index)
+
+    def percentiles(self, qs=(50, 95, 99)):
+        if not self.count:
+            return tuple(0.0 for _ in qs)
+        return tuple(np.percentile(self.data[:self.count], qs))
+
+
+class FrameProfiler:
+    """Times each phase of the game loop into ring buffers of the last `size` frames.
+
+    The loop calls start_frame() and then mark(phase) as each phase ends; the
+    time since the previous mark is charged to that phase. Timings are in ms.
+    """
+
+    def __init__(self, size=600, refresh_frames=15):
+        """
+        refresh_frames: the overlay text is re-rendered this often, so it stays readable.
+        """
+        self.buffers = {phase: RingBuffer(size) for phase in PHASES}
+        self.frame_buffer = RingBuffer(size)  # Whole frames
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.overlay = False
+        self.refresh_frames = refresh_frames
+        self._frame_start = self._last = 0.0
+        self._frames = 0
+        self._lines = []
+        self._overlay_rect = None
+
+    def start_frame(self):
+        self._frame_start = self._last = time.perf_counter()
+        for phase in PHASES:
+            self.current[phase] = 0.0
+
+    def mark(self, phase):
+        """Ends a phase; it may be marked more than once per frame (the times add up)."""
+        now = time.perf_counter()
+        self.current[phase] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        for phase in PHASES:
+            self.buffers[phase].add(self.current[phase])
+        self.frame_buffer.add((self._last - self._frame_start) * 1000)
+        self._frames += 1
+
+    def summary(self):
+        """{phase: (p50, p95, p99)} in ms over the buffered frames, plus "frame" for whole frames."""
+        stats = {phase: self.buffers[phase].percentiles() for phase in PHASES}
+        stats["frame"] = self.frame_buffer.percentiles()
+        return stats
+
+    def samples(self, phase):
+        """Buffered timings of one phase ("frame" for whole frames), oldest first."""
+        return (self.frame_buffer if phase == "frame" else self.buffers[phase]).values()
+
+    def toggle_overlay(self, dirty=None):
+        """Shows or hides the overlay; when hiding, marks its area so the game shows through again."""
+        self.overlay = not self.overlay
+        if not self.overlay and dirty is not None and self._overlay_rect:
+            dirty.add(self._overlay_rect)
+        self._lines = []
+
+    def draw_overlay(self, screen, dirty=None):
+        """Draws the p50/p95/p99 table in the top-right corner of the screen."""
+        if not self.overlay:
+            return
+        if not self._lines or self._frames % self.refresh_frames == 0:
+            font = get_sysfont("monospace", 16)
+            rows = [f"{'phase':<10}{'p50':>6} {'p95':>6} {'p99':>6}"]
+            for phase, (p50, p95, p99) in self.summary().items():
+                rows.append(f"{phase:<10}{p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            self._lines = [render_text(font, row, (255, 255, 0)) for row in rows]
+
+        width = max(line.get_width() for line in self._lines) + 10
+        height = sum(line.get_height() for line in self._lines) + 10
+        rect = pygame.Rect(screen.get_width() - width - 5, 5, width, height)
+        screen.fill((0, 0, 0), rect)
+        y = rect.y + 5
+        for line in self._lines:
+            screen.blit(line, (rect.x + 5, y))
+            y += line.get_height()
+        self._overlay_rect = rect
+        if dirty is not None:
+            dirty.add(rect)
@@ -1,20 +1,44 @@
 from abc import ABC, abstractmethod
+import random
 import pygame
 from src.engines.board import Board
+from src.engines.dirty_regions import DirtyRegions
+from src.engines.frame_profiler import FrameProfiler
+from src.engines.sampling_profiler import sampling_profiler
 from src.engines.player import Player
 from src.engines.scoring_system import ScoringSystem
 
 class Game(ABC):
     """Base class for all games"""
-    
-    def __init__(self, width, height, player1: Player, player2: Player, scoring_rules=None):
+    name = "game"  # Short id used in replay files
+    caption = "TMGE"  # Window title while the game runs
+
+    def __init__(self, width, height, player1: Player, player2: Player, scoring_rules=None, seed=None, headless=False):
         self.board = Board(width, height) # Games now call board size
+        self.display_size = (width, height)  # Window size the game draws for; games with other units override it
         self.player1 = player1
         self.player2 = player2
         self.running = True
+        self.headless = headless  # No window; used for replays and simulations
+        self.frame = 0
+        self.frame_ms = 0  # Real time the last frame took, in whole milliseconds (from clock.tick)
+        self.recorder = None  # ReplayRecorder while a recorded loop runs
+
+        # Every random draw in a game goes through self.rng so matches can be replayed
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        # Games report the screen rects they changed in render(); the loop presents them
+        self.dirty = DirtyRegions()
+        # Per-phase frame timings; F3 shows them over the game
+        self.profiler = FrameProfiler()
 
         self.scoring_system = ScoringSystem(scoring_rules if scoring_rules else {})
 
+    @classmethod
+    def warm_up(cls):
+        """Does the game's first-use work ahead of time (the splash screen runs this on a worker thread)."""
+        pass
+
     @abstractmethod
     def update_board(self):
         """Each game defines its own board update logic."""
@@ -25,25 +49,88 @@ class Game(ABC):
         """Each game defines its own game-over condition."""
         raise NotImplementedError("Subclasses must implement is_game_over()")
 
-    def run_game_loop(self, screen, clock, fps):
-        """Universal game loop for all TMGE games."""
+    def run_game_loop(self, screen, clock, fps, recorder=None):
+        """Universal game loop for all TMGE games (the arcade drives the same steps from a GameScene)."""
+        self.start_loop(fps, recorder)
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    self.handle_player_input(event)  # Calls game-specific input handling
+            self.profiler.start_frame()
+            # F9 belongs to the sampling profiler, not the game
+            events = [event for event in pygame.event.get() if not sampling_profiler.handle_hotkey(event)]
+            self.process_events(events)
+            self.advance()
+            self.draw_frame(screen)
+            self.end_frame(clock.tick(fps))
+        self.finish_loop()
+
+    def start_loop(self, fps, recorder=None):
+        """Gets ready to run frames at fps, optionally recording them."""
+        self.recorder = recorder
+        self.frame_ms = round(1000 / fps)  # Nothing measured yet; assume an on-time frame
+
+    def process_events(self, events):
+        """Handles one frame's events: QUIT, the F3 overlay, then recording and game input."""
+        profiler = self.profiler
+        profiler.mark("events")
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay(self.dirty)
+            else:
+                if self.recorder:
+                    self.recorder.record(self.frame, event)
+                self.handle_player_input(event)  # Calls game-specific input handling
+
+        if self.recorder:
+            self.recorder.record_frame_time(self.frame, self.frame_ms)
+        profiler.mark("input")
 
-            self.update_board()  # Calls game-specific board update logic
-            if self.is_game_over():
-                self.running = False  # Stop if game-over condition is met
+    def advance(self):
+        """Updates the game by one frame and checks for game over."""
+        self.update_board()  # Calls game-specific board update logic
+        self.profiler.mark("update")
+        if self.is_game_over():
+            self.running = False  # Stop if game-over condition is met
+        self.profiler.mark("game_over")
 
-            self.render(screen)  # Calls game rendering
-            clock.tick(fps)
+    def draw_frame(self, screen):
+        """Renders the frame and pushes the changed regions to the display."""
+        self.render(screen)  # Calls game rendering
+        self.profiler.draw_overlay(screen, self.dirty)
+        self.profiler.mark("render")
+        self.dirty.present()  # Push only the changed regions to the display
+        self.profiler.mark("present")
+
+    def end_frame(self, frame_ms):
+        """Closes the frame; frame_ms is how long it took (what clock.tick returned)."""
+        self.frame_ms = frame_ms
+        self.profiler.mark("wait")
+        self.profiler.end_frame()
+        self.frame += 1
+
+    def finish_loop(self):
+        """Finishes the recording and releases the game's resources once it stops running."""
+        if self.recorder:
+            self.recorder.finish(self)
+            self.recorder = None
+        self.close()
 
         # pygame.quit()
         print(f"Game Over! Final Score: {self.scoring_system.get_score()}")
 
+    def close(self):
+        """Releases anything the game holds beyond the loop (e.g. worker threads)."""
+        pass
+
+    @property
+    def frame_dt(self):
+        """Seconds of real time to simulate this frame; games with their own timestep use it."""
+        return self.frame_ms / 1000
+
+    def get_scores(self):
+        """Returns (player 1 score, player 2 score)."""
+        return self.player1.score, self.player2.score
+
     @abstractmethod
     def handle_player_input(self, action):
         """Handle player input for movement or actions"""
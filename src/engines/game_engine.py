@@ -1,20 +1,23 @@
+import os
 import sys
-from src.games.tetris import TetrisGame
-from src.games.suika import SuikaGame
+import time
 from src.engines.player import Player
-from src.engines.profile_manager import ProfileManager
-import pygame
+from src.engines.game_registry import load_game_class
+from src.engines.profile_manager import profile_manager
+from src.engines.replay import ReplayRecorder
+from src.ui.scene import GameScene
 # import pymunk
-import numpy as np
 # from src.engines.game import Game
 
 
 class GameEngine:
-    def __init__(self, screen_manager):
+    def __init__(self, screen_manager, replay_dir="replays", keep_replays=50):
         self.games = []
+        self.replay_dir = replay_dir  # Every match is recorded here; None disables recording
+        self.keep_replays = keep_replays  # Most recordings kept; older ones are deleted (None keeps all)
         self.timer = 0
         self.screen_manager = screen_manager
-        self.profile_manager = ProfileManager()
+        self.profile_manager = profile_manager  # Shared with the login screen
         self.player1 = Player()
         self.player2 = Player()
 
@@ -35,46 +38,64 @@ class GameEngine:
         self.screen_manager.set_screen("game_selection")
 
     # works with ui > login_screen.py
-    def set_player(self, player1, player2, profile_manager):
+    def set_player(self, player1, player2):
         """Store logged in player's data."""
         self.player1 = player1
         self.player2 = player2
-        self.profile_manager = profile_manager
+
+    def start_recording(self, game, fps, options=None):
+        """Opens a replay recorder for a match, or returns None if recording is off."""
+        if not self.replay_dir:
+            return None
+        os.makedirs(self.replay_dir, exist_ok=True)
+        self.prune_replays()
+        filename = os.path.join(self.replay_dir, f"{game.name}-{time.strftime('%Y%m%d-%H%M%S')}-{game.seed}.tmr")
+        return ReplayRecorder(filename, game, fps, options)
+
+    def prune_replays(self):
+        """Deletes the oldest recordings so that, with the one about to start, at most keep_replays remain."""
+        if self.keep_replays is None:
+            return
+        replays = [os.path.join(self.replay_dir, name) for name in os.listdir(self.replay_dir) if name.endswith(".tmr")]
+        replays.sort(key=os.path.getmtime)
+        for filename in replays[:max(len(replays) - self.keep_replays + 1, 0)]:
+            try:
+                os.remove(filename)
+            except OSError as error:
+                print(f"Could not delete old replay {filename}: {error}")
+
+    def save_scores(self, score1, score2):
+        """Store both players' scores from a finished match."""
+        # The stored score also counts anything another cabinet saved for the same player meanwhile
+        self.player1.score = self.profile_manager.update_profile_score(self.player1.name, score1, slot=1)
+        self.player2.score = self.profile_manager.update_profile_score(self.player2.name, score2, slot=2)
+        self.profile_manager.save_profiles()
 
     def runSuika(self):
         """Run instance of Suika after selecting Suika button"""
         print("Running Suika")
-        suika_game = SuikaGame(self.player1, self.player2, two_player=True)
-        SIZE = WIDTH, HEIGHT = np.array([570, 770])
-        SIZE = (WIDTH * 2 if True else WIDTH, HEIGHT)
-        screen = pygame.display.set_mode(SIZE)
-        suika_game.run_game_loop(screen, pygame.time.Clock(), 60)
-
-        self.player1.score = suika_game.scoring_p1.get_score()
-        self.player2.score = suika_game.scoring_p2.get_score()
-        self.profile_manager.update_profile_score(self.player1.name, self.player1.score)
-        self.profile_manager.update_profile_score(self.player2.name, self.player2.score)
-        self.profile_manager.save_profiles()
+        # Games are imported the first time they're selected, which keeps pymunk out of startup
+        suika_game = load_game_class("suika")(self.player1, self.player2, two_player=True)
+        recorder = self.start_recording(suika_game, GameScene.fps, {"two_player": True, "physics_hz": suika_game.physics_hz,
+                                                                 "physics_profile": suika_game.physics_profile})
+        # The game runs on top of the selection screen and returns to it when it ends
+        self.screen_manager.push(GameScene(self.screen_manager, suika_game, recorder, on_finish=self.suika_finished))
 
+    def suika_finished(self, suika_game):
+        self.save_scores(suika_game.scoring_p1.get_score(), suika_game.scoring_p2.get_score())
 
     def runTetris(self):
         """Run instance of Tetris after selecting Suika button"""
         print("Running Tetris")
-        tetris_game = TetrisGame(self.player1, self.player2)
-        screen = pygame.display.set_mode((tetris_game.board.width * 30 * 2 + 60, tetris_game.board.height * 30))
-        clock = pygame.time.Clock()
-        tetris_game.run_game_loop(screen, clock, 60)
+        tetris_game = load_game_class("tetris")(self.player1, self.player2)
+        recorder = self.start_recording(tetris_game, GameScene.fps)
+        self.screen_manager.push(GameScene(self.screen_manager, tetris_game, recorder, on_finish=self.tetris_finished))
 
-        self.player1.score = tetris_game.player1.score  # Assuming the game updated these
-        self.player2.score = tetris_game.player2.score
-        self.profile_manager.update_profile_score(self.player1.name, self.player1.score)
-        self.profile_manager.update_profile_score(self.player2.name, self.player2.score)
-        self.profile_manager.save_profiles()
+    def tetris_finished(self, tetris_game):
+        self.save_scores(tetris_game.player1.score, tetris_game.player2.score)  # Assuming the game updated these
         print(self.player1.score)
         print(self.player2.score)
-        print(self.profile_manager.profiles)
-
-        pygame.display.set_mode((1200, 800))
+        print(self.profile_manager.top_scores())
         self.screen_manager.set_screen("main_menu")
 
 
@@ -0,0 +1,53 @@
+import importlib
+
+
+class GameEntry:
+    """A game the arcade can run, imported the first time it is needed.
+
+    Game modules pull in their heavy dependencies (pymunk, NumPy) at import
+    time, so the registry only knows where a class lives until load() is called.
+    """
+
+    def __init__(self, name, module_name, class_name, title=None):
+        """
+        name: short id, the same one Game.name and replay files use.
+        module_name, class_name: where the Game subclass lives.
+        title: what the menus call it.
+        """
+        self.name = name
+        self.module_name = module_name
+        self.class_name = class_name
+        self.title = title or name.title()
+        self.game_class = None
+
+    @property
+    def loaded(self):
+        return self.game_class is not None
+
+    def load(self):
+        """Imports the game's module (once) and returns its class."""
+        if self.game_class is None:
+            module = importlib.import_module(self.module_name)
+            self.game_class = getattr(module, self.class_name)
+        return self.game_class
+
+    def warm_up(self):
+        """Loads the game and lets it prepare its assets, so its first match starts without a hitch."""
+        self.load().warm_up()
+
+
+GAMES = {}
+
+
+def register_game(name, module_name, class_name, title=None):
+    GAMES[name] = GameEntry(name, module_name, class_name, title)
+    return GAMES[name]
+
+
+def load_game_class(name):
+    """Imports and returns the game class registered under a name."""
+    return GAMES[name].load()
+
+
+register_game("tetris", "src.games.tetris", "TetrisGame", "Tetris")
+register_game("suika", "src.games.suika", "SuikaGame", "Suika")
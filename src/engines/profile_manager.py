@@ -1,35 +1,149 @@
 import json
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Bumped whenever the table layout changes; stored in the database's user_version
+#   1: name, score
+#   2: + version, bumped by every score write
+SCHEMA_VERSION = 2
+
 
 class ProfileManager:
-    def __init__(self, filename="profiles.json"):
+    """Player profiles (only the total score for now) in a SQLite database.
+
+    Nothing is read up front: each lookup is one indexed query and each score
+    update is its own small transaction, so launches and saves stay fast however
+    many players the file holds. The database runs in WAL mode, so readers
+    (the scores screen) never block a writer.
+
+    Several arcade processes may share the file. Every row carries a version;
+    a write starts with BEGIN IMMEDIATE (SQLite's write lock, held for that
+    one row's update only) and, if another process changed the row since we
+    last read it, adds our change to their score instead of overwriting it.
+
+    The first time a database is created, profiles from the old profiles.json
+    are imported into it; the JSON file itself is left untouched.
+    """
+
+    def __init__(self, filename="profiles.db", json_filename="profiles.json"):
         self.filename = filename
+        self.json_filename = json_filename
+        # (name, slot) -> (score, version) as that player slot last read or wrote it. Per slot, so
+        # one profile logged in as both players merges both saves instead of the second overwriting
+        self.seen = {}
+        self._connection = None  # Opened on first use
+        self._lock = threading.RLock()  # One connection, shared by whichever thread asks
+
+    @property
+    def connection(self):
+        with self._lock:
+            if self._connection is None:
+                new = not os.path.exists(self.filename)
+                # isolation_level=None: transactions are opened explicitly by _write()
+                # check_same_thread is off because screens may be built on the warm-up thread; _lock serializes use
+                self._connection = sqlite3.connect(self.filename, timeout=5.0, isolation_level=None,
+                                                   check_same_thread=False)
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._create_schema()
+                if new and self.json_filename and os.path.exists(self.json_filename):
+                    self._import_json(self.json_filename)
+            return self._connection
+
+    @contextmanager
+    def _write(self):
+        """A transaction that holds the database's write lock from the start, so its reads can't go stale."""
+        with self._lock:
+            connection = self.connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _create_schema(self):
+        with self._write() as db:
+            schema = db.execute("PRAGMA user_version").fetchone()[0]
+            if schema < 1:
+                db.execute("CREATE TABLE IF NOT EXISTS profiles "
+                           "(name TEXT PRIMARY KEY, score INTEGER NOT NULL DEFAULT 0)")
+                db.execute("CREATE INDEX IF NOT EXISTS profiles_by_score ON profiles (score DESC)")
+            if schema < 2:
+                db.execute("ALTER TABLE profiles ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-        # if the path exists,
-        # read the file and store the profiles
-        # otherwise, we initialize an empty dictionary
-        if os.path.exists(self.filename):
-            with open(self.filename, "r") as file:
-                self.profiles = json.load(file)
-        else:
-            self.profiles = {}
-
-    def get_profile(self, username):
-        # if the username exists, return it
-        if username in self.profiles:
-            return self.profiles[username]
-        else:
-            # Only keeping track of total score
-            # If it doesn't exist, initialize with score of 0
-            self.profiles[username] = {"score": 0}
-            return self.profiles[username]
-
-    def update_profile_score(self, username, score):
-        # update score if the username exists
-        if username in self.profiles:
-            self.profiles[username]["score"] = score
+    def _import_json(self, json_filename):
+        """Copies every profile from the old whole-file JSON store, in one transaction."""
+        with open(json_filename, "r") as file:
+            profiles = json.load(file)
+        with self._write() as db:
+            db.executemany("INSERT OR IGNORE INTO profiles (name, score) VALUES (?, ?)",
+                           ((name, data.get("score", 0)) for name, data in profiles.items()))
+        print(f"Imported {len(profiles)} profiles from {json_filename}")
+
+    def _read(self, db, username):
+        return db.execute("SELECT score, version FROM profiles WHERE name = ?", (username,)).fetchone()
+
+    def get_profile(self, username, slot=None):
+        # Only keeping track of total score
+        # If the username doesn't exist, it is created with a score of 0
+        # slot: which player (1, 2) is logging in with it; pass the same slot to update_profile_score
+        with self._lock:
+            row = self._read(self.connection, username)
+            if row is None:
+                with self._write() as db:
+                    db.execute("INSERT OR IGNORE INTO profiles (name) VALUES (?)", (username,))
+                    row = self._read(db, username)
+            self.seen[username, slot] = row
+        return {"score": row[0], "version": row[1]}
+
+    def update_profile_score(self, username, score, slot=None):
+        """Writes a player's new score (if the player exists); returns the score stored.
+
+        If anyone else (another process, or this profile in the other player
+        slot) wrote the row after this slot last read or wrote it, the
+        difference between our score and the one we saw is added to theirs, so
+        both writers' points count. Callers should carry on from the returned
+        score, which includes the other writer's points.
+        """
+        with self._write() as db:
+            row = self._read(db, username)
+            if row is None:
+                return score  # Not a saved player; nothing to store
+            current, version = row
+            base = self.seen.get((username, slot))
+            if base is not None and base[1] != version:
+                score = current + (score - base[0])  # Someone else's write came first; merge ours in
+            db.execute("UPDATE profiles SET score = ?, version = ? WHERE name = ?", (score, version + 1, username))
+            self.seen[username, slot] = (score, version + 1)
+        return score
 
     def save_profiles(self):
-        # save the profiles to the file
-        with open(self.filename, "w") as file:
-            json.dump(self.profiles, file, indent=4)
+        # Every update is already committed; kept so callers don't have to change
+        pass
+
+    def top_scores(self, limit=10):
+        """[(name, score)] for the highest scores, best first."""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT name, score FROM profiles ORDER BY score DESC, name LIMIT ?", (limit,)).fetchall()
+
+    @property
+    def profiles(self):
+        """Every profile as {name: {"score": score}}; reads the whole table, so only for small tools and debugging."""
+        with self._lock:
+            rows = self.connection.execute("SELECT name, score FROM profiles").fetchall()
+        return {name: {"score": score} for name, score in rows}
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# The one ProfileManager every screen and the game engine share in this process
+profile_manager = ProfileManager()
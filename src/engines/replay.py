@@ -0,0 +1,227 @@
+import json
+import struct
+import sys
+import pygame
+from src.engines.player import Player
+from src.engines.game_registry import load_game_class
+
+# Binary replay format (little endian):
+#   header:  b"TMGR", version (B), game name, seed (Q), fps (H), options (JSON),
+#            then name + starting score for both players
+#   records: frame delta (H), event type (B), key/button/frame ms (i), x (h), y (h)
+#   footer:  END record, then frames played (I) and both final scores (q, q)
+# Version 3 added FRAME_TIMES records; version 2 files (FRAME_TIME only) still play.
+MAGIC = b"TMGR"
+VERSION = 3
+READABLE_VERSIONS = (2, 3)
+RECORD = struct.Struct("<HBihh")
+FOOTER = struct.Struct("<Iqq")
+
+# Event types stored in records. Every frame's Game.frame_ms is stored, so variable
+# timestep games replay the same steps:
+#   FRAME_TIMES: a run of frames ending just before the record's frame; x is the base
+#                frame ms, y the number of frames, and bit i of value is set if the
+#                run's i-th frame took base + 1 ms (clock.tick alternates 16 and 17 at
+#                60 FPS). Runs where every frame took exactly base ms may be any length.
+#   FRAME_TIME:  frame ms for this frame and the ones after it, for times too long for x
+NOOP, KEYDOWN, KEYUP, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, END, FRAME_TIME, FRAME_TIMES = range(9)
+RUN_BITS = 31  # Most frames a FRAME_TIMES run with any base + 1 ms frames can hold (value is signed)
+MAX_RUN = 0x7FFF
+EVENT_CODES = {
+    pygame.KEYDOWN: KEYDOWN,
+    pygame.KEYUP: KEYUP,
+    pygame.MOUSEMOTION: MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN: MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP: MOUSEBUTTONUP,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+def _write_str(file, text):
+    data = text.encode("utf-8")
+    file.write(struct.pack("<H", len(data)))
+    file.write(data)
+
+
+def _read_str(file):
+    (length,) = struct.unpack("<H", file.read(2))
+    return file.read(length).decode("utf-8")
+
+
+class ReplayRecorder:
+    """Writes the inputs passed to Game.handle_player_input as a frame-indexed binary log."""
+
+    def __init__(self, filename, game, fps, options=None):
+        """
+        options: extra keyword arguments the game was created with (e.g. two_player),
+        so the replay can rebuild the same game.
+        """
+        self.filename = filename
+        self.file = open(filename, "wb")
+        self.last_frame = 0
+        # The FRAME_TIMES run being collected: first frame, base ms, base + 1 ms bits, length
+        self.run_start = 0
+        self.run_base = None
+        self.run_bits = 0
+        self.run_length = 0
+
+        self.file.write(MAGIC + struct.pack("<B", VERSION))
+        _write_str(self.file, game.name)
+        self.file.write(struct.pack("<QH", game.seed, fps))
+        _write_str(self.file, json.dumps(options or {}))
+        for player in (game.player1, game.player2):
+            _write_str(self.file, player.name)
+            self.file.write(struct.pack("<q", player.score))
+
+    def record(self, frame, event):
+        """Appends one input event for the given frame."""
+        code = EVENT_CODES.get(event.type)
+        if code is None:
+            return
+        if code in (KEYDOWN, KEYUP):
+            value, (x, y) = event.key, (0, 0)
+        elif code == MOUSEMOTION:
+            value, (x, y) = 0, event.pos
+        else:
+            value, (x, y) = event.button, event.pos
+        self._write(frame, code, value, x, y)
+
+    def record_frame_time(self, frame, frame_ms):
+        """Stores the frame time the game will simulate for this frame (called once per frame, in order)."""
+        if self.run_base is not None and frame == self.run_start + self.run_length:
+            extra = frame_ms - self.run_base
+            if extra == -1 and self.run_bits == 0 and self.run_length < RUN_BITS:
+                # Every frame so far took base ms; re-base the run one lower so this one fits too
+                self.run_base = frame_ms
+                self.run_bits = (1 << self.run_length) - 1
+                extra = 0
+            if extra == 0 and self.run_length < (MAX_RUN if self.run_bits == 0 else RUN_BITS):
+                self.run_length += 1
+                return
+            if extra == 1 and self.run_length < RUN_BITS:
+                self.run_bits |= 1 << self.run_length
+                self.run_length += 1
+                return
+        self._flush_run()
+        if 0 <= frame_ms < MAX_RUN:
+            self.run_start, self.run_base, self.run_bits, self.run_length = frame, frame_ms, 0, 1
+        else:
+            self._write(frame, FRAME_TIME, frame_ms, 0, 0)
+
+    def _flush_run(self):
+        # Written at the frame after the run, which keeps records in frame order behind that frame's inputs
+        if self.run_base is not None:
+            self._write(self.run_start + self.run_length, FRAME_TIMES, self.run_bits, self.run_base, self.run_length)
+            self.run_base = None
+
+    def finish(self, game):
+        """Writes the footer with the number of frames played and the final scores, then closes the file."""
+        self._flush_run()
+        self._write(game.frame, END, 0, 0, 0)
+        self.file.write(FOOTER.pack(game.frame, *game.get_scores()))
+        self.file.close()
+
+    def _write(self, frame, code, value, x, y):
+        delta = frame - self.last_frame
+        # Frame gaps too long for one record are bridged with NOOP records
+        while delta > 0xFFFF:
+            self.file.write(RECORD.pack(0xFFFF, NOOP, 0, 0, 0))
+            delta -= 0xFFFF
+        self.file.write(RECORD.pack(delta, code, value, x, y))
+        self.last_frame = frame
+
+
+class ReplayPlayer:
+    """Reads a replay file and re-runs the match headless, as fast as possible."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as file:
+            if file.read(4) != MAGIC:
+                raise ValueError(f"{filename} is not a replay file")
+            (version,) = struct.unpack("<B", file.read(1))
+            if version not in READABLE_VERSIONS:
+                raise ValueError(f"Unsupported replay version {version}")
+            self.game_name = _read_str(file)
+            self.seed, self.fps = struct.unpack("<QH", file.read(10))
+            self.options = json.loads(_read_str(file))
+            self.players = []
+            for _ in range(2):
+                name = _read_str(file)
+                (score,) = struct.unpack("<q", file.read(8))
+                self.players.append((name, score))
+
+            # Group events by frame
+            self.events = {}
+            self.frame_times = {}
+            self.frames = None
+            self.final_scores = None
+            frame = 0
+            while True:
+                data = file.read(RECORD.size)
+                if len(data) < RECORD.size:
+                    break  # Match was cut off before finishing
+                delta, code, value, x, y = RECORD.unpack(data)
+                frame += delta
+                if code == END:
+                    self.frames, *scores = FOOTER.unpack(file.read(FOOTER.size))
+                    self.final_scores = tuple(scores)
+                    break
+                if code == FRAME_TIME:
+                    self.frame_times[frame] = value
+                elif code == FRAME_TIMES:
+                    for i in range(y):
+                        self.frame_times[frame - y + i] = x + (value >> i & 1)
+                elif code != NOOP:
+                    self.events.setdefault(frame, []).append(self._to_event(code, value, x, y))
+
+    @staticmethod
+    def _to_event(code, value, x, y):
+        if code in (KEYDOWN, KEYUP):
+            return pygame.event.Event(EVENT_TYPES[code], key=value)
+        if code == MOUSEMOTION:
+            return pygame.event.Event(EVENT_TYPES[code], pos=(x, y))
+        return pygame.event.Event(EVENT_TYPES[code], button=value, pos=(x, y))
+
+    def create_game(self):
+        """Builds the recorded game with the same seed, players and options, without a window."""
+        game_cls = load_game_class(self.game_name)
+        player1, player2 = (Player(name) for name, _ in self.players)
+        player1.score, player2.score = (score for _, score in self.players)
+        return game_cls(player1, player2, seed=self.seed, headless=True, **self.options)
+
+    def play(self):
+        """Re-runs the match frame by frame (same order as Game.run_game_loop) and returns the game.
+
+        Every frame the recording played is re-run, including the one the match ended in.
+        """
+        game = self.create_game()
+        last_frame = self.frames if self.frames is not None else max(self.events, default=0)
+        while game.running and game.frame < last_frame:
+            for event in self.events.get(game.frame, ()):
+                game.handle_player_input(event)
+            game.frame_ms = self.frame_times.get(game.frame, game.frame_ms)
+            game.update_board()
+            if game.is_game_over():
+                game.running = False
+            game.frame += 1
+        game.close()
+        return game
+
+    def verify(self):
+        """Plays the replay and returns (replayed scores, matches the recorded scores)."""
+        scores = self.play().get_scores()
+        return scores, scores == self.final_scores
+
+
+def main(filenames):
+    for filename in filenames:
+        player = ReplayPlayer(filename)
+        scores, matches = player.verify()
+        print(f"{filename}: {player.game_name} seed={player.seed} scores={scores} "
+              f"recorded={player.final_scores} {'OK' if matches else 'MISMATCH'}")
+
+
+# RUN "python -m src.engines.replay <file>..." to re-run recorded matches
+if __name__ == "__main__":
+    main(sys.argv[1:])
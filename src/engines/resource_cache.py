@@ -0,0 +1,95 @@
+import os
+import threading
+from collections import OrderedDict
+import pygame
+
+FONT_DIR = os.path.join("assets", "fonts")
+
+
+class ResourceCache:
+    """Process-wide cache for fonts and rendered text surfaces.
+
+    Fonts are kept forever, keyed by (file, size). Rendered text lives in an
+    LRU keyed by (font, text, color, antialias) that evicts the least recently
+    used surfaces once their pixel memory passes text_memory_limit bytes.
+    It is locked, so the splash screen's warm-up thread can fill it while the
+    main thread draws.
+    """
+
+    def __init__(self, text_memory_limit=16 * 1024 * 1024):
+        self.fonts = {}
+        self.texts = OrderedDict()
+        self.text_memory = 0
+        self.text_memory_limit = text_memory_limit
+        self.lock = threading.RLock()  # Re-entrant: get_font falls back to itself
+
+    def get_font(self, file_name, size):
+        """Returns the font for a file in assets/fonts (None for pygame's default font)."""
+        key = (file_name, size)
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is None:
+                if file_name is None:
+                    font = pygame.font.Font(None, size)
+                else:
+                    font_path = os.path.join(FONT_DIR, file_name)
+                    if os.path.exists(font_path):
+                        font = pygame.font.Font(font_path, size)
+                    else:
+                        print(f"Font not found at {font_path}; using default font.")
+                        font = self.get_font(None, size)
+                self.fonts[key] = font
+            return font
+
+    def get_sysfont(self, name, size):
+        """Returns a system font; the slow system font lookup only happens once per (name, size)."""
+        key = ("sysfont", name, size)
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is None:
+                font = self.fonts[key] = pygame.font.SysFont(name, size)
+            return font
+
+    def render_text(self, font, text, color, antialias=True):
+        """Returns a rendered text surface, reusing it while it stays in the LRU."""
+        key = (font, text, tuple(color), bool(antialias))
+        with self.lock:
+            surface = self.texts.get(key)
+            if surface is not None:
+                self.texts.move_to_end(key)
+                return surface
+
+            surface = font.render(text, antialias, color)
+            self.texts[key] = surface
+            self.text_memory += self._surface_bytes(surface)
+            while self.text_memory > self.text_memory_limit and len(self.texts) > 1:
+                _, old = self.texts.popitem(last=False)
+                self.text_memory -= self._surface_bytes(old)
+            return surface
+
+    def clear(self):
+        """Drops every cached font and text surface."""
+        with self.lock:
+            self.fonts.clear()
+            self.texts.clear()
+            self.text_memory = 0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared by every screen and game in the process
+resource_cache = ResourceCache()
+
+
+def get_font(file_name, size):
+    return resource_cache.get_font(file_name, size)
+
+
+def get_sysfont(name, size):
+    return resource_cache.get_sysfont(name, size)
+
+
+def render_text(font, text, color, antialias=True):
+    return resource_cache.render_text(font, text, color, antialias)
@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+import pygame
+
+# Key that starts/stops the profiler from any screen or game
+HOTKEY = pygame.K_F9
+
+
+class SamplingProfiler:
+    """Samples the Python stack of one thread at a fixed interval, from a background thread.
+
+    Nothing is hooked into the profiled code, so the overhead is one stack walk
+    per sample. stop() writes two files:
+      <name>.collapsed  "outer;...;inner count" lines, the input flamegraph.pl and
+                        speedscope read
+      <name>.txt        per-function self and total sample counts
+    """
+
+    def __init__(self, interval=0.005, output_dir="profiling"):
+        """
+        interval: seconds between samples (5 ms = 200 samples a second).
+        output_dir: where stop() writes its files.
+        """
+        self.interval = interval
+        self.output_dir = output_dir
+        self.stacks = Counter()
+        self.samples = 0
+        self.running = False
+        self._thread = None
+        self._target = None
+        self._stop = threading.Event()
+
+    def start(self, thread_id=None):
+        """Starts sampling a thread (the calling one by default)."""
+        if self.running:
+            return
+        self._target = thread_id or threading.get_ident()
+        self.stacks.clear()
+        self.samples = 0
+        self._stop.clear()
+        self.running = True
+        self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        print("Sampling profiler started")
+
+    def stop(self, name=None):
+        """Stops sampling and writes the output files; returns their common path (without extension)."""
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self.running = False
+        path = self.write(name or time.strftime("profile-%Y%m%d-%H%M%S"))
+        print(f"Sampling profiler stopped: {self.samples} samples written to {path}.collapsed/.txt")
+        return path
+
+    def toggle(self):
+        if self.running:
+            return self.stop()
+        self.start()
+        return None
+
+    def handle_hotkey(self, event):
+        """Toggles on the hotkey; returns True if the event was the hotkey."""
+        if event.type == pygame.KEYDOWN and event.key == HOTKEY:
+            self.toggle()
+            return True
+        return False
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue  # Target thread has exited
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def summary(self):
+        """[(function, self samples, total samples)], most self time first."""
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                total[function] += count
+        return sorted(((f, own[f], total[f]) for f in total), key=lambda row: (-row[1], -row[2]))
+
+    def write(self, name):
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, name)
+        with open(path + ".collapsed", "w") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{';'.join(stack)} {count}\n")
+        with open(path + ".txt", "w") as file:
+            samples = max(self.samples, 1)
+            file.write(f"{self.samples} samples every {self.interval * 1000:.1f} ms\n")
+            file.write(f"{'self':>7} {'self%':>6} {'total':>7} {'total%':>6}  function\n")
+            for function, own, total in self.summary():
+                file.write(f"{own:7d} {own / samples:6.1%} {total:7d} {total / samples:6.1%}  {function}\n")
+        return path
+
+
+# Shared by the screens, the game loop and main.py's --profile flag
+sampling_profiler = SamplingProfiler()
@@ -0,0 +1,51 @@
+import threading
+import time
+
+
+class AssetWarmup:
+    """Runs first-use work (imports, font loads, pre-rendering) on a background thread.
+
+    Tasks run one at a time in the order they were added, so add the ones the
+    player needs first first. A failing task is reported and skipped; whatever
+    it was warming is simply built on first use instead.
+    """
+
+    def __init__(self):
+        self.tasks = []  # [(label, function)]
+        self.done = 0
+        self.current = None  # Label of the running task
+        self.errors = []
+        self.timings = []  # [(label, seconds)] for finished tasks
+        self.finished = threading.Event()
+        self._thread = None
+
+    def add(self, label, function):
+        self.tasks.append((label, function))
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="asset-warmup", daemon=True)
+            self._thread.start()
+
+    @property
+    def progress(self):
+        """Fraction of tasks finished, 0.0 to 1.0."""
+        return self.done / len(self.tasks) if self.tasks else 1.0
+
+    def wait(self, timeout=None):
+        """Blocks until every task has run; returns False on timeout."""
+        return self.finished.wait(timeout)
+
+    def _run(self):
+        for label, function in self.tasks:
+            self.current = label
+            start = time.perf_counter()
+            try:
+                function()
+            except Exception as error:
+                print(f"Warm-up of {label} failed: {error}")
+                self.errors.append((label, error))
+            self.timings.append((label, time.perf_counter() - start))
+            self.done += 1
+        self.current = None
+        self.finished.set()
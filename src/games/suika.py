@@ -1,17 +1,18 @@
+import os
 import sys
 import numpy as np
 import pygame
 import pymunk
 import random
+from concurrent.futures import ThreadPoolExecutor
 from src.engines.game import Game
 from src.engines.board import Board
 from src.engines.player import Player
 from src.engines.scoring_system import ScoringSystem
+from src.engines.resource_cache import get_sysfont, render_text
+from src.games.suika_particles import ParticleTable
 
 
-pygame.init()
-rng = np.random.default_rng()
-
 # Constants
 SIZE = WIDTH, HEIGHT = np.array([570, 770])
 PAD = (24, 160)
@@ -34,7 +35,8 @@ COLORS = [
     (100, 235, 10),
     (0, 185, 0),
 ]
-FPS = 240
+PHYSICS_HZ = 240  # Fixed physics steps per simulated second
+MAX_SUBSTEPS = 8  # Most physics steps run in one frame when catching up
 RADII = [17, 25, 32, 38, 50, 63, 75, 87, 100, 115, 135]
 THICKNESS = 14
 DENSITY = 0.001
@@ -42,24 +44,163 @@ ELASTICITY = 0.1
 IMPULSE = 10000
 GRAVITY = 6000
 DAMPING = 0.8
-NEXT_DELAY = FPS
+NEXT_DELAY = 1.0  # Seconds before the next fruit can be dropped
 BIAS = 0.00001
 POINTS = [1, 3, 6, 10, 15, 21, 28, 36, 45, 55, 66]
 shape_to_particle = dict()
 
 
+class PhysicsProfile:
+    """Space settings for a Suika board: sleeping, broadphase, solver iterations and threads."""
+
+    def __init__(self, sleep_time=float("inf"), idle_speed=0, spatial_hash=None,
+                 min_iterations=10, max_iterations=10, bodies_per_iteration=0, threads=1):
+        """
+        sleep_time: seconds a fruit must stay below idle_speed before it sleeps (inf: never).
+        idle_speed: speed (px/s) counted as idle; 0 lets pymunk pick one from gravity.
+        spatial_hash: (cell size, cell count) for a spatial hash broadphase, or None for
+        pymunk's default bounding box tree.
+        min_iterations, max_iterations, bodies_per_iteration: solver iterations start at
+        min_iterations and grow by one per bodies_per_iteration live fruit (0: fixed).
+        threads: solver threads per space (pymunk's threaded solver; 1 is off).
+        """
+        self.sleep_time = sleep_time
+        self.idle_speed = idle_speed
+        self.spatial_hash = spatial_hash
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.bodies_per_iteration = bodies_per_iteration
+        self.threads = threads
+
+    def create_space(self):
+        """A space with this profile's settings, before gravity and walls."""
+        space = pymunk.Space(threaded=self.threads > 1)
+        if self.threads > 1:
+            space.threads = self.threads
+        space.sleep_time_threshold = self.sleep_time
+        space.idle_speed_threshold = self.idle_speed
+        if self.spatial_hash:
+            space.use_spatial_hash(*self.spatial_hash)
+        space.iterations = self.min_iterations
+        return space
+
+    def iterations_for(self, live):
+        """Solver iterations for a board with this many live fruit."""
+        if not self.bodies_per_iteration:
+            return self.min_iterations
+        return min(self.max_iterations, self.min_iterations + live // self.bodies_per_iteration)
+
+
+# Spatial hash cells about the size of the fruit players drop (the first five tiers)
+HASH_CELL = 2 * sum(RADII[:5]) // 5
+HASH_COUNT = 1000
+
+# Profiles SuikaGame(physics_profile=...) can pick by name
+# (python -m src.benchmarks.suika_physics compares them)
+PHYSICS_PROFILES = {
+    # pymunk defaults: nothing sleeps, bounding box tree, 10 iterations
+    "classic": PhysicsProfile(),
+    # Settled fruit sleep, the broadphase is a spatial hash, and small piles use fewer iterations
+    "tuned": PhysicsProfile(sleep_time=0.5, spatial_hash=(HASH_CELL, HASH_COUNT),
+                            min_iterations=6, max_iterations=12, bodies_per_iteration=8),
+    # "tuned" plus pymunk's threaded solver, for big piles on multi-core machines
+    "threaded": PhysicsProfile(sleep_time=0.5, spatial_hash=(HASH_CELL, HASH_COUNT),
+                               min_iterations=6, max_iterations=12, bodies_per_iteration=8, threads=2),
+}
+
+
+class FruitAtlas:
+    """Every fruit tier pre-rendered once, side by side, into a single surface.
+
+    Fruit edges are hard, so the atlas uses an RLE colorkey rather than per-pixel
+    alpha; keyed blits are much cheaper than alpha blending.
+    """
+    colorkey = (255, 0, 255)
+
+    def __init__(self):
+        width = sum(2 * r + 1 for r in RADII)
+        height = 2 * max(RADII) + 1
+        self.surface = pygame.Surface((width, height))
+        self.surface.fill(self.colorkey)
+        self.areas = []
+        x = 0
+        for n, radius in enumerate(RADII):
+            c1 = COLORS[n]
+            c2 = tuple(int(c * 0.8) for c in c1)
+            center = (x + radius, radius)
+            pygame.draw.circle(self.surface, c2, center, radius)
+            pygame.draw.circle(self.surface, c1, center, radius * 0.9)
+            self.areas.append(pygame.Rect(x, 0, 2 * radius + 1, 2 * radius + 1))
+            x += 2 * radius + 1
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+
+    def blit_args(self, n, pos):
+        """Returns (surface, dest, area) to draw tier n centered on pos."""
+        radius = RADII[n]
+        return self.surface, (int(pos[0]) - radius, int(pos[1]) - radius), self.areas[n]
+
+    def draw(self, screen, n, pos):
+        screen.blit(*self.blit_args(n, pos))
+
+
+_fruit_atlas = None
+
+
+def get_fruit_atlas():
+    """Builds the shared fruit atlas on first use (after the display exists, so it can be converted)."""
+    global _fruit_atlas
+    if _fruit_atlas is None:
+        _fruit_atlas = FruitAtlas()
+    return _fruit_atlas
+
+
+class ParticlePool:
+    """Keeps the pymunk body and shape of every killed fruit, per tier, for the next fruit of that tier.
+
+    Merges kill two fruit and create one all game long; recycling keeps the
+    number of pymunk objects at the most fruit ever alive at once.
+    """
+
+    def __init__(self):
+        self.free = [[] for _ in RADII]
+
+    def acquire(self, n):
+        """Returns a (body, shape) for tier n, recycled if one is free."""
+        if self.free[n]:
+            body, shape = self.free[n].pop()
+            body.velocity = (0, 0)
+            body.angular_velocity = 0
+            body.angle = 0
+            body.force = (0, 0)
+            body.torque = 0
+            return body, shape
+        body = pymunk.Body(body_type=pymunk.Body.DYNAMIC)
+        shape = pymunk.Circle(body=body, radius=RADII[n])
+        shape.density = DENSITY
+        shape.elasticity = ELASTICITY
+        shape.collision_type = 1
+        shape.friction = 0.2
+        return body, shape
+
+    def release(self, n, body, shape):
+        """Takes back a body and shape that have been removed from their space."""
+        self.free[n].append((body, shape))
+
+
 class Particle:
-    def __init__(self, pos, n, space, mapper):
+    def __init__(self, pos, n, space, mapper, pool=None):
         self.n = n % 11
         self.radius = RADII[self.n]
-        self.body = pymunk.Body(body_type=pymunk.Body.DYNAMIC)
+        self.pool = pool
+        self.body, self.shape = (pool or ParticlePool()).acquire(self.n)
         self.body.position = tuple(pos)
-        self.shape = pymunk.Circle(body=self.body, radius=self.radius)
-        self.shape.density = DENSITY
-        self.shape.elasticity = ELASTICITY
-        self.shape.collision_type = 1
-        self.shape.friction = 0.2
         self.has_collided = False
+        self.table = None  # Set when the particle gets a ParticleTable slot
+        self.slot = None
+        self.seq = 0  # Spawn order, set by the table
+        self.mapper = mapper
         mapper[self.shape] = self
         print(f"part {self.shape.friction=}")
 
@@ -69,14 +210,16 @@ class Particle:
 
     def draw(self, screen):
         if self.alive:
-            c1 = np.array(COLORS[self.n])
-            c2 = (c1 * 0.8).astype(int)
-            pygame.draw.circle(screen, tuple(c2), self.body.position, self.radius)
-            pygame.draw.circle(screen, tuple(c1), self.body.position, self.radius * 0.9)
+            get_fruit_atlas().draw(screen, self.n, self.body.position)
 
     def kill(self, space):
         space.remove(self.body, self.shape)
         self.alive = False
+        self.mapper.pop(self.shape, None)
+        if self.table:
+            self.table.remove(self)
+        if self.pool:
+            self.pool.release(self.n, self.body, self.shape)
         print(f"Particle {id(self)} killed")
 
     @property
@@ -92,17 +235,14 @@ class PreParticle:
         print(f"PreParticle {id(self)} created")
 
     def draw(self, screen):
-        c1 = np.array(COLORS[self.n])
-        c2 = (c1 * 0.8).astype(int)
-        pygame.draw.circle(screen, tuple(c2), (self.x, PAD[1] // 2), self.radius)
-        pygame.draw.circle(screen, tuple(c1), (self.x, PAD[1] // 2), self.radius * 0.9)
+        get_fruit_atlas().draw(screen, self.n, (self.x, PAD[1] // 2))
 
     def set_x(self, x):
         lim = PAD[0] + self.radius + THICKNESS // 2
         self.x = np.clip(x, lim, WIDTH - lim)
 
-    def release(self, space, mapper):
-        return Particle((self.x, PAD[1] // 2), self.n, space, mapper)
+    def release(self, space, mapper, pool=None):
+        return Particle((self.x, PAD[1] // 2), self.n, space, mapper, pool)
 
 
 class Wall:
@@ -119,34 +259,43 @@ class Wall:
         pygame.draw.line(screen, W_COLOR, self.shape.a, self.shape.b, self.thickness)
 
 
-def resolve_collision(p1, p2, space, particles, mapper, game):
+def resolve_collision(p1, p2, space, mapper, game, pool=None, owner=1):
+    """Merges two same-tier fruit into the next tier; the points go to owner, the player whose board it is."""
     if p1.n == p2.n:
-        distance = np.linalg.norm(p1.pos - p2.pos)
+        distance = p1.body.position.get_distance(p2.body.position)
         if distance < 2 * p1.radius:
             p1.kill(space)
             p2.kill(space)
-            pn = Particle(np.mean([p1.pos, p2.pos], axis=0), p1.n+1, space, mapper)
-            for p in particles:
-                if p.alive:
-                    vector = p.pos - pn.pos
-                    distance = np.linalg.norm(vector)
-                    if distance < pn.radius + p.radius:
-                        impulse = IMPULSE * vector / (distance ** 2)
-                        p.body.apply_impulse_at_local_point(tuple(impulse))
-                        print(f"{impulse=} was applied to {id(p)}")
-            if game.current_turn == 1:
-                game.scoring_p2.add_score("merge", POINTS[p2.n])
-                print(f"Player 2 Score: {game.scoring_p2.get_score()}")
-            else:
-                game.scoring_p1.add_score("merge", POINTS[p1.n])
-                print(f"Player 1 Score: {game.scoring_p1.get_score()}")
+            pn = Particle((p1.body.position + p2.body.position) / 2, p1.n+1, space, mapper, pool)
+            center = pn.body.position
+            # Only fruit whose edge is within pn.radius of the center can be hit,
+            # so ask the space's spatial index instead of scanning every particle
+            for hit in space.point_query(center, pn.radius, pymunk.ShapeFilter()):
+                p = mapper.get(hit.shape)
+                if p is None or p is pn or not p.alive:
+                    continue  # Walls, the new fruit, and the two merged ones
+                vector = p.body.position - center
+                distance = vector.length
+                if distance == 0:
+                    continue  # Exactly on the center: no direction to push it in
+                if distance < pn.radius + p.radius:
+                    impulse = IMPULSE * vector / (distance ** 2)
+                    p.body.apply_impulse_at_local_point(tuple(impulse))
+            # By board, not by whose turn it is: the turn passes as soon as a fruit is dropped
+            scoring = game.scoring_p1 if owner == 1 else game.scoring_p2
+            scoring.add_score("merge", POINTS[p1.n])
+            print(f"Player {owner} Score: {scoring.get_score()}")
             return pn
         
 
     return None
 
 def collide(arbiter, space, data):
-    """Handles collisions between particles of the same type."""
+    """Queues a merge for two touching particles of the same type.
+
+    Nothing is added to or removed from the space here: the callback runs in
+    the middle of space.step, so merges wait for SuikaBoard.process_merges.
+    """
     sh1, sh2 = arbiter.shapes
     mapper = data["mapper"]
 
@@ -158,172 +307,322 @@ def collide(arbiter, space, data):
     if p1.n != p2.n:
         return True  # Do nothing if they are different sizes
 
-    # Merge particles
-    merged_particle = resolve_collision(p1, p2, space, data["particles"], mapper, data["game"])
-
-    if merged_particle:
-        data["particles"].append(merged_particle)
+    if not data["board"].queue_merge(p1, p2):
+        return True  # One of them already merges this step; collide normally
 
     return False
 
 
+class SuikaBoard:
+    """One player's jar: its own pymunk space, walls, fruit and merge queue.
+
+    Boards never touch each other's bodies, so SuikaGame steps their spaces
+    at the same time on worker threads.
+    """
+
+    def __init__(self, game, owner, divider=False, profile=None):
+        """
+        owner: player number (1, 2, ...); board n sits n - 1 jar widths to the right.
+        divider: also add the center wall drawn between two boards.
+        profile: PhysicsProfile for the space (classic settings by default).
+        """
+        self.game = game
+        self.owner = owner
+        self.offset = (owner - 1) * WIDTH
+
+        self.profile = profile or PHYSICS_PROFILES["classic"]
+        self.space = self.profile.create_space()
+        self.space.gravity = (0, GRAVITY)
+        self.space.damping = DAMPING
+        self.space.collision_bias = BIAS
+
+        dx = self.offset
+        self.walls = [
+            Wall((A[0] + dx, A[1]), (B[0] + dx, B[1]), self.space),  # Left border
+            Wall((B[0] + dx, B[1]), (C[0] + dx, C[1]), self.space),  # Bottom border
+            Wall((C[0] + dx, C[1]), (D[0] + dx, D[1]), self.space),  # Right border
+        ]
+        if divider:
+            self.walls.append(Wall((WIDTH, PAD[1]), (WIDTH, HEIGHT - PAD[0]), self.space))
+
+        self.particles = []  # Live fruit only; dead ones are dropped after each merge pass
+        self.shape_to_particle = {}
+        self.pool = ParticlePool()
+        # Same-tier pairs found during a step, merged after it
+        self.merge_queue = []
+        self.merging = set()
+
+        handler = self.space.add_collision_handler(1, 1)
+        handler.begin = collide
+        handler.data["mapper"] = self.shape_to_particle
+        handler.data["board"] = self
+
+    def preview(self, n):
+        """A preview fruit of tier n, a quarter of the way across this board."""
+        return PreParticle(self.offset + WIDTH // 4, n)
+
+    def drop(self, pre_particle):
+        """Releases a preview fruit into this board's space."""
+        particle = pre_particle.release(self.space, self.shape_to_particle, self.pool)
+        self.particles.append(particle)
+        self.game.table.add(particle, owner=self.owner)
+        return particle
+
+    def tune(self):
+        """Sets solver iterations for the current number of fruit."""
+        self.space.iterations = self.profile.iterations_for(len(self.particles))
+
+    def step(self, dt):
+        self.space.step(dt)
+
+    def queue_merge(self, p1, p2):
+        """Queues two particles to merge after this step. False if either is already queued."""
+        if p1 in self.merging or p2 in self.merging:
+            return False
+        self.merging.update((p1, p2))
+        self.merge_queue.append((p1, p2))
+        return True
+
+    def process_merges(self):
+        """Applies the merges queued during the last step, in spawn order.
+
+        Each particle merges at most once per step; a new fruit that touches
+        another of its tier is queued by the next step, so cascades play out
+        one step at a time in the same order on every run.
+        """
+        if not self.merge_queue:
+            return
+        queue = sorted(self.merge_queue, key=lambda pair: sorted((pair[0].seq, pair[1].seq)))
+        self.merge_queue = []
+        self.merging.clear()
+        for p1, p2 in queue:
+            merged_particle = resolve_collision(p1, p2, self.space, self.shape_to_particle, self.game, self.pool,
+                                                self.owner)
+            if merged_particle:
+                self.particles.append(merged_particle)
+                self.game.table.add(merged_particle, self.owner)
+        self.particles = [p for p in self.particles if p.alive]
+
+    def draw(self, screen):
+        for wall in self.walls:
+            wall.draw(screen)
+
+
 class SuikaGame(Game):
     """Suika Game using TMGE"""
-    def __init__(self, player1, player2, two_player=True):
-        super().__init__(WIDTH, HEIGHT, player1, player2, scoring_rules={"merge": 1})
+    name = "suika"
+    caption = "Suika"
+
+    def __init__(self, player1, player2, two_player=True, seed=None, headless=False,
+                 physics_hz=PHYSICS_HZ, max_substeps=MAX_SUBSTEPS, parallel=None, physics_profile="tuned",
+                 bot1=None, bot2=None):
+        """
+        physics_hz: fixed physics rate, independent of the frame rate the loop runs at.
+        max_substeps: cap on steps per frame; after a long stall the backlog is dropped.
+        parallel: step the boards on worker threads; by default only with more than one CPU,
+        since on a single core the hand-off costs more than it saves.
+        physics_profile: name of a PHYSICS_PROFILES entry.
+        bot1, bot2: SuikaBot (or anything with next_drop) playing for that player instead of the mouse.
+        """
+        super().__init__(WIDTH, HEIGHT, player1, player2, scoring_rules={"merge": 1}, seed=seed, headless=headless)
         pygame.init()
 
         self.running = True
-        self.space = pymunk.Space()
-        self.space.gravity = (0, GRAVITY)
-        self.space.damping = DAMPING
-        self.space.collision_bias = BIAS
         self.two_player = two_player  
         self.scoring_p1 = ScoringSystem(scoring_rules={"merge": 1}) 
         self.scoring_p2 = ScoringSystem(scoring_rules={"merge": 1})
 
         # Track which player's turn it is
         self.current_turn = 1  # Player 1 starts first
-
-        # Create game walls
-        self.walls_p1 = [
-            Wall(A, B, self.space),  # Left border
-            Wall(B, C, self.space),  # Bottom border
-            Wall(C, D, self.space)   # Right border
-        ]
-
-        if self.two_player:
-            self.walls_p2 = [
-                Wall((A[0] + WIDTH, A[1]), (B[0] + WIDTH, B[1]), self.space), 
-                Wall((B[0] + WIDTH, B[1]), (C[0] + WIDTH, C[1]), self.space), 
-                Wall((C[0] + WIDTH, C[1]), (D[0] + WIDTH, D[1]), self.space)   
-            ]
-            # Add a center wall to separate players
-            center_x = WIDTH
-            self.walls_p1.append(Wall((center_x, PAD[1]), (center_x, HEIGHT - PAD[0]), self.space))
-            self.walls_p2.append(Wall((center_x, PAD[1]), (center_x, HEIGHT - PAD[0]), self.space))
-
-        # Separate lists for particles
-        self.shape_to_particle = {}
-        self.particles_p1 = []
-        self.particles_p2 = []
-        self.wait_for_next = 0
+        self.bots = {1: bot1, 2: bot2}
+
+        # Array view of all particles, synced once per physics step
+        self.table = ParticleTable()
+
+        # One board (space, walls, fruit) per player
+        n_players = 2 if self.two_player else 1
+        self.physics_profile = physics_profile
+        profile = PHYSICS_PROFILES[physics_profile]
+        self.boards = [SuikaBoard(self, owner, divider=self.two_player, profile=profile)
+                       for owner in range(1, n_players + 1)]
+        self.display_size = (int(WIDTH) * n_players, int(HEIGHT))
+
+        # Boards after the first step on worker threads; pymunk releases the GIL inside space.step
+        if parallel is None:
+            parallel = (os.cpu_count() or 1) > 1
+        self.executor = None
+        if parallel and n_players > 1:
+            self.executor = ThreadPoolExecutor(max_workers=n_players - 1, thread_name_prefix="suika-physics")
+
+        self.wait_for_next = 0  # Physics steps until the next drop is allowed
+
+        # Fixed timestep: real frame time is banked and spent in whole physics steps
+        self.physics_hz = physics_hz
+        self.step_dt = 1 / physics_hz
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.alpha = 1.0  # How far render draws between the last two physics steps
 
         # Only one preview piece is needed
-        self.next_particle = PreParticle(WIDTH // 4, rng.integers(0, 5))
+        self.next_particle = self.boards[0].preview(self.rng.randrange(0, 5))
 
-        # Attach collision handler AFTER defining shape_to_particle
-        handler = self.space.add_collision_handler(1, 1)
-        handler.begin = collide  # Correct function reference
-        handler.data["mapper"] = self.shape_to_particle
-        handler.data["particles"] = self.particles_p1
-        if self.two_player:
-            handler.data["particles"] += self.particles_p2
-        handler.data["game"] = self
+    @property
+    def particles_p1(self):
+        return self.boards[0].particles
 
+    @property
+    def particles_p2(self):
+        return self.boards[1].particles if self.two_player else []
+
+    @classmethod
+    def warm_up(cls):
+        get_fruit_atlas()
+        get_sysfont("monospace", 32)
+        # The first space built pays for pymunk's one-time setup (collision handler callbacks)
+        board = SuikaBoard(None, 1, profile=PHYSICS_PROFILES["tuned"])
+        board.step(1 / PHYSICS_HZ)
+
+    def close(self):
+        """Stops the physics worker threads and any bots' worker processes."""
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        for bot in self.bots.values():
+            if hasattr(bot, "close"):
+                bot.close()
 
     def update_board(self):
-        """Handles physics updates and checks for new particle spawning."""
-        self.space.step(1 / FPS)  # Update physics simulation
+        """Advances physics by the real time the last frame took, in fixed-size steps."""
+        self._run_bots()
+
+        self.accumulator += self.frame_dt
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_substeps:
+            # Too far behind to catch up; drop the backlog instead of falling further behind
+            steps = self.max_substeps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_dt
+
+        for board in self.boards:
+            board.tune()
+        for i in range(steps):
+            if i == steps - 1 and not self.headless:
+                self.table.sync(keep_previous=True)  # Render interpolates across the last step
+            self.step_physics()
+        self.table.sync()
+        self.alpha = self.accumulator / self.step_dt
+
+        if self.is_game_over():
+            self.running = False  # Stop the game loop when one player loses
+
+    def step_physics(self):
+        """Runs one fixed physics step on every board, their queued merges, and the drop timer."""
+        # Step every board at once, then merge one board at a time on this thread
+        if self.executor:
+            futures = [self.executor.submit(board.step, self.step_dt) for board in self.boards[1:]]
+            self.boards[0].step(self.step_dt)
+            for future in futures:
+                future.result()
+        else:
+            for board in self.boards:
+                board.step(self.step_dt)
+        for board in self.boards:
+            board.process_merges()
 
         if self.wait_for_next > 1:
             self.wait_for_next -= 1
         elif self.wait_for_next == 1:
             # Only spawn a new preview piece if it is None
             if self.next_particle is None:
-                if self.current_turn == 1:
-                    self.next_particle = PreParticle(WIDTH // 4, rng.integers(0, 5))  # Player 1's preview
-                else:
-                    self.next_particle = PreParticle(WIDTH + WIDTH // 4, rng.integers(0, 5))  # Player 2's preview
+                self.next_particle = self.boards[self.current_turn - 1].preview(self.rng.randrange(0, 5))
 
             self.wait_for_next -= 1  # Reset delay
 
-        if self.is_game_over():
-            self.running = False  # Stop the game loop when one player loses
-
     def is_game_over(self):
         """Ends the game immediately if a particle overflows."""
-        for p in self.particles_p1:
-            if p.pos[1] < PAD[1] and p.has_collided:  # Check if Player 1 loses
-                print(f"Game Over for Player 1! Final Score: {self.scoring_p1}")
-                self.running = False
-                return True
+        if self.table.overflowing(1, PAD[1]):  # Check if Player 1 loses
+            print(f"Game Over for Player 1! Final Score: {self.scoring_p1}")
+            self.running = False
+            return True
 
-        if self.two_player:
-            for p in self.particles_p2:
-                if p.pos[1] < PAD[1] and p.has_collided:  # Check if Player 2 loses
-                    print(f"Game Over for Player 2! Final Score: {self.scoring_p2}")
-                    self.running = False
-                    return True
+        if self.two_player and self.table.overflowing(2, PAD[1]):  # Check if Player 2 loses
+            print(f"Game Over for Player 2! Final Score: {self.scoring_p2}")
+            self.running = False
+            return True
 
         return False  # No player has lost yet
 
+    def get_scores(self):
+        """Returns (player 1 score, player 2 score)."""
+        return self.scoring_p1.get_score(), self.scoring_p2.get_score()
+
     def handle_player_input(self, event):
         """Handles mouse-based input for turn-based dropping of pieces."""
+        if self.bots.get(self.current_turn):
+            return  # The bot plays this turn
 
         if event.type == pygame.MOUSEMOTION and self.next_particle:
             mouse_x, _ = event.pos
-
-            if self.current_turn == 1:
-                # Player 1's preview orb moves inside their board
-                self.next_particle.set_x(np.clip(mouse_x, PAD[0], WIDTH - PAD[0]))
-            elif self.current_turn == 2:
-                # Player 2's preview orb moves inside their board
-                self.next_particle.set_x(np.clip(mouse_x - WIDTH, PAD[0], WIDTH - PAD[0]))  
-                self.next_particle.x += WIDTH
+            self.move_preview(mouse_x)
 
         if event.type == pygame.MOUSEBUTTONDOWN and self.wait_for_next == 0 and self.next_particle:
-            if self.current_turn == 1:
-                # Drop Player 1's piece inside left board
-                self.particles_p1.append(self.next_particle.release(self.space, self.shape_to_particle))
-            else:
-                # Drop Player 2's piece inside right board
-                self.particles_p2.append(self.next_particle.release(self.space, self.shape_to_particle))
+            self.drop()
+
+    def move_preview(self, x):
+        """Moves the preview orb to screen x, kept inside the current player's board."""
+        board = self.boards[self.current_turn - 1]
+        self.next_particle.set_x(np.clip(x - board.offset, PAD[0], WIDTH - PAD[0]))
+        self.next_particle.x += board.offset
 
+    def drop(self):
+        """Drops the preview fruit into the current player's board and passes the turn."""
+        self.boards[self.current_turn - 1].drop(self.next_particle)
 
-            self.wait_for_next = NEXT_DELAY  # Add delay before next piece spawns
-            self.next_particle = None  # 🚀 Prevent immediate preview spawning
+        self.wait_for_next = round(NEXT_DELAY * self.physics_hz)  # Add delay before next piece spawns
+        self.next_particle = None  # 🚀 Prevent immediate preview spawning
 
-            # Switch player AFTER dropping
-            self.current_turn = 1 if self.current_turn == 2 else 2
+        # Switch player AFTER dropping
+        self.current_turn = self.current_turn % len(self.boards) + 1
 
-            # Ensure the next particle is spawned in the correct location
-            if self.current_turn == 1:
-                self.next_particle = PreParticle(WIDTH // 4, rng.integers(0, 5))  # Player 1's side
-            else:
-                self.next_particle = PreParticle(WIDTH + (WIDTH // 4), rng.integers(0, 5))  # Player 2's side
+        # Ensure the next particle is spawned in the correct location
+        self.next_particle = self.boards[self.current_turn - 1].preview(self.rng.randrange(0, 5))
+
+    def _run_bots(self):
+        """Lets a bot-controlled player drop once it has decided where."""
+        bot = self.bots.get(self.current_turn)
+        if bot and self.next_particle:
+            x = bot.next_drop(self, self.current_turn)
+            if x is not None:
+                self.move_preview(x)
+                if self.wait_for_next == 0:
+                    self.drop()
 
     def render(self, screen):
         """Draws all game elements on screen with the correct original board size."""
         screen.fill(BG_COLOR)
 
         # Draw walls
-        for wall in self.walls_p1:
-            wall.draw(screen)
-        if self.two_player:
-            for wall in self.walls_p2:
-                wall.draw(screen)
+        for board in self.boards:
+            board.draw(screen)
 
-        # Draw Player 1's particles
-        for p in self.particles_p1:
-            p.draw(screen)
-        # Draw Player 2's particles
-        for p in self.particles_p2:
-            p.draw(screen)
+        # Draw both players' particles with one batched blit from the fruit atlas
+        screen.blits(self.table.blit_list(get_fruit_atlas(), self.alpha), doreturn=False)
 
         # Only draw the preview for the active player IF IT EXISTS
         if self.next_particle:
             self.next_particle.draw(screen)
 
-        font = pygame.font.SysFont("monospace", 32)
-        label_p1 = font.render(f"Player 1 Score: {self.scoring_p1.get_score()}", 1, (0, 0, 0))
-        label_p2 = font.render(f"Player 2 Score: {self.scoring_p2.get_score()}", 1, (0, 0, 0))
+        font = get_sysfont("monospace", 32)
+        label_p1 = render_text(font, f"Player 1 Score: {self.scoring_p1.get_score()}", (0, 0, 0))
+        label_p2 = render_text(font, f"Player 2 Score: {self.scoring_p2.get_score()}", (0, 0, 0))
 
         screen.blit(label_p1, (10, 10))  # Player 1's score in top-left
         if self.two_player:
             screen.blit(label_p2, (WIDTH + 10, 10))  # Player 2's score in top-right
 
-        pygame.display.flip()
+        # Fruit move every frame, so the whole window changes
+        self.dirty.add_all()
 
     # RUN "python -m src.engines.game_engine" to run the game - Wilson
 # def main():
@@ -0,0 +1,168 @@
+import multiprocessing
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from src.engines.scoring_system import ScoringSystem
+from src.games.suika import (SuikaBoard, PreParticle, PHYSICS_PROFILES, NEXT_DELAY,
+                             RADII, PAD, WIDTH, HEIGHT, THICKNESS)
+from src.games.suika_particles import ParticleTable
+
+# Everything a worker needs to rebuild one board: a tuple of
+# (x, y, vx, vy, angle, angular velocity, tier) per live fruit, in board coordinates
+BoardState = namedtuple("BoardState", ["fruit", "profile"])
+
+
+def snapshot(board):
+    """Copies a SuikaBoard's live fruit into a picklable BoardState (x relative to the board)."""
+    fruit = []
+    for particle in board.particles:
+        body = particle.body
+        fruit.append((body.position.x - board.offset, body.position.y,
+                      body.velocity.x, body.velocity.y, body.angle, body.angular_velocity, particle.n))
+    return BoardState(tuple(fruit), board.game.physics_profile)
+
+
+class Simulation:
+    """Just enough of a SuikaGame to step one board off-screen in a worker."""
+
+    def __init__(self, state):
+        self.physics_profile = state.profile
+        self.table = ParticleTable()
+        self.scoring_p1 = ScoringSystem(scoring_rules={"merge": 1})
+        self.scoring_p2 = ScoringSystem(scoring_rules={"merge": 1})
+        self.current_turn = 1
+        self.board = SuikaBoard(self, owner=1, profile=PHYSICS_PROFILES[state.profile])
+        for x, y, vx, vy, angle, angular_velocity, n in state.fruit:
+            body = self.board.drop(PreParticle(x, n)).body
+            body.position = (x, y)
+            body.velocity = (vx, vy)
+            body.angle = angle
+            body.angular_velocity = angular_velocity
+
+    def points(self):
+        return self.scoring_p1.get_score() + self.scoring_p2.get_score()
+
+    def stack_top(self):
+        """Highest point (smallest y) of any fruit, or the jar floor if it's empty."""
+        return min((p.body.position.y - p.radius for p in self.board.particles), default=HEIGHT - PAD[0])
+
+    def run(self, seconds, hz):
+        dt = 1 / hz
+        for _ in range(int(seconds * hz)):
+            self.board.step(dt)
+            self.board.process_merges()
+
+
+def simulate_drop(state, x, n, seconds, hz, height_weight):
+    """Drops tier n at x on a copy of the board and scores the result after some seconds.
+
+    Score is merge points gained minus height_weight per pixel of stack height;
+    a stack that reaches the top of the jar scores -inf.
+    """
+    sim = Simulation(state)
+    sim.board.drop(PreParticle(x, n))
+    start_points = sim.points()
+    sim.run(seconds, hz)
+    top = sim.stack_top()
+    if top < PAD[1]:
+        return float("-inf")
+    return sim.points() - start_points - height_weight * (HEIGHT - PAD[0] - top)
+
+
+def _quiet_worker():
+    """Process pool initializer: the game's debug prints would flood the console."""
+    sys.stdout = open(os.devnull, "w")
+
+
+class SuikaBot:
+    """AI player for SuikaGame that picks where to drop each fruit.
+
+    When a fruit appears, the bot snapshots its board and simulates dropping
+    it at evenly spaced x positions, each in a worker process. It drops at the best result once all simulations
+    finish, or at the best finished one when NEXT_DELAY seconds have passed.
+    """
+
+    def __init__(self, candidates=12, seconds=1.5, hz=120, height_weight=0.05, workers=None, deadline=NEXT_DELAY):
+        """
+        candidates: x positions tried per fruit.
+        seconds, hz: how far ahead and at what step rate each drop is simulated.
+        height_weight: points a pixel of stack height costs.
+        deadline: real seconds the bot may think before it must drop.
+        """
+        self.candidates = candidates
+        self.seconds = seconds
+        self.hz = hz
+        self.height_weight = height_weight
+        self.deadline = deadline
+        # Workers start mid-match, when SDL and the physics threads are running; forking that
+        # process can deadlock the child, so they come from a fork server (or the platform's
+        # default, spawn) instead. BoardState snapshots pickle, so nothing relies on fork.
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_quiet_worker)
+        self._preview = None
+        self._xs = None
+        self._futures = []
+        self._started = 0
+
+    def candidate_xs(self, n):
+        """Drop positions (board coordinates) for tier n, edge to edge."""
+        lim = PAD[0] + RADII[n] + THICKNESS // 2
+        return np.linspace(lim, WIDTH - lim, self.candidates)
+
+    def plan(self, game, player):
+        """Starts simulating every candidate drop for the current preview fruit."""
+        board = game.boards[player - 1]
+        state = snapshot(board)
+        n = game.next_particle.n
+        self._preview = game.next_particle
+        self._xs = self.candidate_xs(n)
+        try:
+            self._futures = [self.executor.submit(simulate_drop, state, float(x), n, self.seconds, self.hz,
+                                                  self.height_weight) for x in self._xs]
+        except BrokenProcessPool as error:
+            print(f"Suika bot workers unavailable: {error}")
+            self._futures = []
+        self._started = time.perf_counter()
+
+    def choose(self):
+        """Best x so far (board coordinates), or None while simulations are still due."""
+        if not self._futures:
+            return float(self._xs[len(self._xs) // 2])  # No workers; drop in the middle
+        done = [future.done() for future in self._futures]
+        if not all(done) and time.perf_counter() - self._started < self.deadline:
+            return None
+        scores = [self._score(future) if finished else float("-inf")
+                  for future, finished in zip(self._futures, done)]
+        if max(scores) == float("-inf"):
+            return float(self._xs[len(self._xs) // 2])  # Nothing usable; drop in the middle
+        return float(self._xs[int(np.argmax(scores))])
+
+    @staticmethod
+    def _score(future):
+        """A finished simulation's score; a worker that failed scores -inf instead of raising into the game loop."""
+        try:
+            return future.result()
+        except Exception as error:
+            print(f"Suika bot simulation failed: {error!r}")
+            return float("-inf")
+
+    def next_drop(self, game, player):
+        """Returns the screen x to drop the preview fruit at, or None if the bot is still thinking."""
+        if game.next_particle is not self._preview:
+            self.plan(game, player)
+        x = self.choose()
+        if x is None:
+            return None
+        return x + game.boards[player - 1].offset
+
+    def close(self):
+        for future in self._futures:
+            future.cancel()
+        self.executor.shutdown()
@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class ParticleTable:
+    """Struct-of-arrays view of every Suika particle, synced from pymunk once per step.
+
+    Each particle owns a slot (row) in the arrays. Game-over checks, queries
+    and rendering read the arrays instead of looping over Particle objects.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.prev_pos = np.zeros((capacity, 2))  # Positions one physics step earlier, for interpolation
+        self.radius = np.zeros(capacity)
+        self.tier = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.collided = np.zeros(capacity, dtype=bool)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.particles = [None] * capacity  # Slot -> Particle
+        self.size = 0  # Slots handed out so far (live or free)
+        self.free = []  # Slots of removed particles, reused before new ones
+        self.added = 0  # Particles ever added; gives each one a spawn-order number
+
+    def add(self, particle, owner):
+        """Gives a particle a slot (reusing a freed one first) and records its static data."""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow()
+            slot = self.size
+            self.size += 1
+        particle.table = self
+        particle.slot = slot
+        particle.seq = self.added
+        self.added += 1
+        self.particles[slot] = particle
+        self.pos[slot] = self.prev_pos[slot] = particle.body.position
+        self.radius[slot] = particle.radius
+        self.tier[slot] = particle.n
+        self.owner[slot] = owner
+        self.collided[slot] = particle.has_collided
+        self.alive[slot] = True
+        return slot
+
+    def remove(self, particle):
+        """Marks a particle's slot dead and frees it for the next particle."""
+        self.alive[particle.slot] = False
+        self.particles[particle.slot] = None
+        self.free.append(particle.slot)
+
+    def live_slots(self):
+        return np.flatnonzero(self.alive[:self.size])
+
+    def sync(self, keep_previous=False):
+        """Copies positions and collision flags of live particles from their pymunk bodies.
+
+        keep_previous: also store the positions in prev_pos; done before the
+        last physics step of a frame so rendering can interpolate across it.
+        """
+        slots = self.live_slots()
+        if len(slots):
+            particles = self.particles
+            self.pos[slots] = [particles[i].body.position for i in slots]
+            self.collided[slots] = [particles[i].has_collided for i in slots]
+            if keep_previous:
+                self.prev_pos[slots] = self.pos[slots]
+
+    def overflowing(self, owner, limit_y):
+        """True if any live particle of the owner sits above limit_y after it has collided."""
+        n = self.size
+        return bool(np.any(self.alive[:n] & self.collided[:n] & (self.owner[:n] == owner)
+                           & (self.pos[:n, 1] < limit_y)))
+
+    def count(self, owner=None):
+        """Number of live particles (of one owner, or overall)."""
+        alive = self.alive[:self.size]
+        if owner is None:
+            return int(alive.sum())
+        return int((alive & (self.owner[:self.size] == owner)).sum())
+
+    def blit_list(self, atlas, alpha=1.0):
+        """(surface, dest, area) tuples for drawing every live particle from the fruit atlas.
+
+        alpha: how far to draw between prev_pos (0) and pos (1).
+        """
+        slots = self.live_slots()
+        pos = self.pos[slots]
+        if alpha < 1.0:
+            prev = self.prev_pos[slots]
+            pos = prev + (pos - prev) * alpha
+        dests = (pos - self.radius[slots, None]).astype(int).tolist()
+        surface, areas = atlas.surface, atlas.areas
+        return [(surface, dest, areas[t]) for dest, t in zip(dests, self.tier[slots].tolist())]
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in ("pos", "prev_pos", "radius", "tier", "alive", "collided", "owner"):
+            old = getattr(self, name)
+            new = np.zeros((self.capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.particles.extend([None] * (self.capacity - len(self.particles)))
@@ -1,10 +1,11 @@
 import pygame
-import random
-from typing import List, Tuple, Optional
+from typing import List, NamedTuple, Tuple, Optional
 
 from src.engines.player import Player
 from src.engines.game import Game
 from src.engines.board import Board
+from src.engines.resource_cache import get_font, render_text
+from src.games.tetris_bitboard import TetrisBitBoard
 
 # Tetris constants
 BOARD_WIDTH = 10
@@ -23,6 +24,33 @@ TETROMINO_SHAPES = {
     'L': [(2, 0), (0, 1), (1, 1), (2, 1)]
 }
 
+# Points clear_lines awards for each line cleared
+POINTS_PER_LINE = 100
+
+# Scoring rules handed to the game's ScoringSystem
+TETRIS_SCORING_RULES = {
+    "line_clear_1": 100,
+    "line_clear_2": 300,
+    "line_clear_3": 600,
+    "line_clear_4": 1000
+}
+
+# Key bindings per player (bots press the same keys)
+PLAYER1_KEYS = {
+    "left": pygame.K_a,
+    "right": pygame.K_d,
+    "rotate": pygame.K_w,
+    "soft_drop": pygame.K_s,
+    "hard_drop": pygame.K_SPACE
+}
+PLAYER2_KEYS = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "rotate": pygame.K_UP,
+    "soft_drop": pygame.K_DOWN,
+    "hard_drop": pygame.K_RCTRL
+}
+
 SHAPE_COLORS = {
     'I': (0, 255, 255),
     'O': (255, 255, 0),
@@ -33,14 +61,49 @@ SHAPE_COLORS = {
     'L': (255, 165, 0)
 }
 
+
+class Orientation(NamedTuple):
+    """One precomputed rotation of a tetromino."""
+    blocks: Tuple[Tuple[int, int], ...]
+    # (dx, lowest dy) for every column the piece covers, used for drop distance
+    col_bottoms: Tuple[Tuple[int, int], ...]
+
+
+def _build_orientations(blocks) -> Tuple[Orientation, ...]:
+    """Builds all four rotations of a block layout, each turn mapping (dx, dy) to (-dy, dx)."""
+    orientations = []
+    for _ in range(4):
+        blocks = tuple(blocks)
+        bottoms = {}
+        for dx, dy in blocks:
+            bottoms[dx] = max(dy, bottoms.get(dx, dy))
+        orientations.append(Orientation(blocks, tuple(sorted(bottoms.items()))))
+        blocks = [(-dy, dx) for (dx, dy) in blocks]
+    return tuple(orientations)
+
+
+# Frozen rotation tables, built once at import
+TETROMINO_ORIENTATIONS = {shape: _build_orientations(blocks) for shape, blocks in TETROMINO_SHAPES.items()}
+
+
 class TetrisPiece:
     """Represents a single falling Tetrimino with shape, position, and orientation."""
-    def __init__(self, shape: str, x: int, y: int):
+    __slots__ = ("shape", "rotation", "x", "y")
+
+    def __init__(self, shape: str, x: int, y: int, rotation: int = 0):
         self.shape = shape
-        self.blocks = TETROMINO_SHAPES[shape]
+        self.rotation = rotation
         self.x = x
         self.y = y
 
+    @property
+    def orientation(self) -> Orientation:
+        return TETROMINO_ORIENTATIONS[self.shape][self.rotation]
+
+    @property
+    def blocks(self) -> Tuple[Tuple[int, int], ...]:
+        return TETROMINO_ORIENTATIONS[self.shape][self.rotation].blocks
+
     def get_block_positions(self) -> List[Tuple[int, int]]:
         """Returns the positions of the blocks for this piece."""
         return [(self.x + dx, self.y + dy) for (dx, dy) in self.blocks]
@@ -50,28 +113,46 @@ class TetrisPiece:
         self.x += dx
         self.y += dy
 
-    def rotate(self):
-        new_blocks = [(-dy, dx) for (dx, dy) in self.blocks]
-        self.blocks = new_blocks
+    def rotate(self, turns: int = 1):
+        """Rotates the piece by switching to another precomputed orientation."""
+        self.rotation = (self.rotation + turns) % 4
 
 
 class TetrisGame(Game):
-    def __init__(self, player1: Player, player2: Player):
-        super().__init__(BOARD_WIDTH, BOARD_HEIGHT, player1, player2, {
-            "line_clear_1": 100,
-            "line_clear_2": 300,
-            "line_clear_3": 600,
-            "line_clear_4": 1000
-        })
+    name = "tetris"
+    caption = "Two-Player Tetris"
+
+    def __init__(self, player1: Player, player2: Player, bitboard: bool = False, bot1=None, bot2=None,
+                 cached_render: bool = False, seed: Optional[int] = None, headless: bool = False):
+        super().__init__(BOARD_WIDTH, BOARD_HEIGHT, player1, player2, TETRIS_SCORING_RULES,
+                         seed=seed, headless=headless)
 
         # Create two separate boards for the two players:
-        self.board1 = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
-        self.board2 = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+        # bitboard=True stores each row as an int mask (faster for simulations)
+        self.bitboard = bitboard
+        if bitboard:
+            self.board1 = TetrisBitBoard(BOARD_WIDTH, BOARD_HEIGHT)
+            self.board2 = TetrisBitBoard(BOARD_WIDTH, BOARD_HEIGHT)
+        else:
+            self.board1 = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+            self.board2 = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+
+        # Row index of the highest locked cell per column (BOARD_HEIGHT when empty)
+        self.column_tops1 = [BOARD_HEIGHT] * BOARD_WIDTH
+        self.column_tops2 = [BOARD_HEIGHT] * BOARD_WIDTH
 
         # Create two active pieces
         self.active_piece1: Optional[TetrisPiece] = None
         self.active_piece2: Optional[TetrisPiece] = None
 
+        # Optional AI players (e.g. TetrisBot) that replace keyboard input
+        self.bot1 = bot1
+        self.bot2 = bot2
+
+        # Preview of each player's next piece
+        self.next_shape1 = self.rng.choice(list(TETROMINO_SHAPES.keys()))
+        self.next_shape2 = self.rng.choice(list(TETROMINO_SHAPES.keys()))
+
         # Gravity timers
         self.drop_timer1 = 0.0
         self.drop_timer2 = 0.0
@@ -82,11 +163,18 @@ class TetrisGame(Game):
         self.game_over1 = False
         self.game_over2 = False
 
+        # cached_render=True draws from cached layers instead of redrawing everything each frame
+        self.cached_render = cached_render
+        self._layers = None
+        self._layer_dirty = {1: True, 2: True}
+        self._layer_rows = {1: None, 2: None}
+        self._regions = {}
+
         # pygame.init()
         self.screen_width = BOARD_WIDTH * BLOCK_SIZE * 2 + 60
         self.screen_height = BOARD_HEIGHT * BLOCK_SIZE
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.display.set_caption("Two-Player Tetris")
+        self.display_size = (self.screen_width, self.screen_height)
+        self.screen = None  # The display surface, handed over by render()
 
         # Spawn initial pieces
         self.spawn_piece1()
@@ -94,6 +182,8 @@ class TetrisGame(Game):
 
     def update_board(self):
         dt = 1.0 / 60.0  # If you prefer a fixed step; or measure real dt from clock
+        self._run_bots()
+
         # Player 1 gravity
         if not self.game_over1 and self.active_piece1:
             self.drop_timer1 += dt
@@ -120,13 +210,34 @@ class TetrisGame(Game):
     def handle_player_input(self, event):
         if event.type == pygame.KEYDOWN:
             # Player 1
-            if not self.game_over1 and self.active_piece1:
+            if not self.game_over1 and self.active_piece1 and not self.bot1:
                 self._handle_player1_keys(event.key)
             # Player 2
-            if not self.game_over2 and self.active_piece2:
+            if not self.game_over2 and self.active_piece2 and not self.bot2:
                 self._handle_player2_keys(event.key)
 
+    def _run_bots(self):
+        """Lets bot-controlled players press their next key for this frame."""
+        if self.bot1 and not self.game_over1 and self.active_piece1:
+            key = self.bot1.next_key(self, player=1)
+            if key is not None:
+                self._handle_player1_keys(key)
+        if self.bot2 and not self.game_over2 and self.active_piece2:
+            key = self.bot2.next_key(self, player=2)
+            if key is not None:
+                self._handle_player2_keys(key)
+
+    @classmethod
+    def warm_up(cls) -> None:
+        font = get_font(None, 30)
+        render_text(font, "GAME OVER!", (255, 0, 0))
+
     def render(self, screen):
+        self.screen = screen
+        if self.cached_render:
+            self._render_layered()
+            return
+
         self.screen.fill((0, 0, 0))  # Black background
 
         # Draw board1
@@ -134,98 +245,192 @@ class TetrisGame(Game):
         # Draw board2
         self._draw_board(self.board2, offset_x=(BOARD_WIDTH * BLOCK_SIZE + 60), offset_y=0)
 
-        # Draw active pieces
+        # Draw ghost pieces and active pieces
         if self.active_piece1 and not self.game_over1:
+            self._draw_ghost(self.active_piece1, self.ghost_y(self.active_piece1, self.board1, player=1), offset_x=0)
             self._draw_piece(self.active_piece1, offset_x=0)
         if self.active_piece2 and not self.game_over2:
+            self._draw_ghost(self.active_piece2, self.ghost_y(self.active_piece2, self.board2, player=2),
+                             offset_x=(BOARD_WIDTH * BLOCK_SIZE + 60))
             self._draw_piece(self.active_piece2, offset_x=(BOARD_WIDTH * BLOCK_SIZE + 60))
 
         # Display each player's name and score
-        font = pygame.font.Font(None, 30)
-        p1_text = font.render(f"{self.player1.name} Score: {self.player1.score}", True, (255, 255, 255))
-        p2_text = font.render(f"{self.player2.name} Score: {self.player2.score}", True, (255, 255, 255))
+        font = get_font(None, 30)
+        p1_text = render_text(font, f"{self.player1.name} Score: {self.player1.score}", (255, 255, 255))
+        p2_text = render_text(font, f"{self.player2.name} Score: {self.player2.score}", (255, 255, 255))
         self.screen.blit(p1_text, (10, 10))
         self.screen.blit(p2_text, (BOARD_WIDTH * BLOCK_SIZE + 70, 10))
 
         # If game over for a player, show message
         if self.game_over1:
-            over_text = font.render("GAME OVER!", True, (255, 0, 0))
+            over_text = render_text(font, "GAME OVER!", (255, 0, 0))
             self.screen.blit(over_text, (50, self.screen_height // 2 - 20))
         if self.game_over2:
-            over_text = font.render("GAME OVER!", True, (255, 0, 0))
+            over_text = render_text(font, "GAME OVER!", (255, 0, 0))
             self.screen.blit(over_text, ((BOARD_WIDTH * BLOCK_SIZE + 110), self.screen_height // 2 - 20))
 
-        pygame.display.flip()
+        self.dirty.add_all()
+
+    def _render_layered(self):
+        """Draws cached board layers, then only the active pieces and score text on top.
+
+        Only the regions that changed since the last frame are reported to self.dirty.
+        """
+        board2_x = BOARD_WIDTH * BLOCK_SIZE + 60
+        if self._layers is None:
+            self._init_layers()
+            self.screen.fill((0, 0, 0))
+            self.dirty.add_all()
+
+        # Locked cells only change on lock_piece / clear_lines
+        for player, board_array, offset_x in ((1, self.board1, 0), (2, self.board2, board2_x)):
+            if self._layer_dirty[player]:
+                self._rebuild_layer(player, board_array)
+                top, bottom = self._layer_rows[player] or (0, BOARD_HEIGHT - 1)
+                self.dirty.add((offset_x, top * BLOCK_SIZE, BOARD_WIDTH * BLOCK_SIZE + 1,
+                                (bottom - top + 1) * BLOCK_SIZE + 1))
+                self._layer_rows[player] = None
+
+        self.screen.blit(self._layers[1], (0, 0))
+        self.screen.blit(self._layers[2], (board2_x, 0))
+        self.screen.fill((0, 0, 0), pygame.Rect(BOARD_WIDTH * BLOCK_SIZE + 1, 0, 59, self.screen_height))
+
+        for player, piece, board_array, over, offset_x in ((1, self.active_piece1, self.board1, self.game_over1, 0),
+                                                           (2, self.active_piece2, self.board2, self.game_over2, board2_x)):
+            piece_rect = ghost_rect = None
+            if piece and not over:
+                ghost_y = self.ghost_y(piece, board_array, player=player)
+                self._draw_ghost(piece, ghost_y, offset_x=offset_x)
+                self._draw_piece(piece, offset_x=offset_x)
+                piece_rect = self._piece_rect(piece, offset_x)
+                ghost_rect = self._piece_rect(piece, offset_x, y=ghost_y)
+            self._track_region(("piece", player), piece_rect)
+            self._track_region(("ghost", player), ghost_rect)
+
+        self._blit_label("score1", f"{self.player1.name} Score: {self.player1.score}", (255, 255, 255), (10, 10))
+        self._blit_label("score2", f"{self.player2.name} Score: {self.player2.score}", (255, 255, 255),
+                         (BOARD_WIDTH * BLOCK_SIZE + 70, 10))
+        if self.game_over1:
+            self._blit_label("over1", "GAME OVER!", (255, 0, 0), (50, self.screen_height // 2 - 20))
+        if self.game_over2:
+            self._blit_label("over2", "GAME OVER!", (255, 0, 0),
+                             ((BOARD_WIDTH * BLOCK_SIZE + 110), self.screen_height // 2 - 20))
+
+    def _piece_rect(self, piece: TetrisPiece, offset_x: int, y: Optional[int] = None) -> pygame.Rect:
+        """Screen rect covering a piece (at its own row, or at row y)."""
+        y = piece.y if y is None else y
+        xs = [piece.x + dx for dx, _ in piece.blocks]
+        ys = [y + dy for _, dy in piece.blocks]
+        return pygame.Rect(offset_x + min(xs) * BLOCK_SIZE, min(ys) * BLOCK_SIZE,
+                           (max(xs) - min(xs) + 1) * BLOCK_SIZE + 1, (max(ys) - min(ys) + 1) * BLOCK_SIZE + 1)
+
+    def _track_region(self, slot, rect: Optional[pygame.Rect]):
+        """Marks a slot's old and new rect dirty when its contents moved or changed."""
+        previous = self._regions.get(slot)
+        if previous != rect:
+            if previous is not None:
+                self.dirty.add(previous)
+            if rect is not None:
+                self.dirty.add(rect)
+            self._regions[slot] = rect
+
+    def _blit_label(self, slot, text: str, color, pos):
+        """Blits a cached label and marks it dirty only when its text changed."""
+        surface = render_text(get_font(None, 30), text, color)
+        self.screen.blit(surface, pos)
+        rect = surface.get_rect(topleft=pos)
+        if self._regions.get(("text", slot)) != text:
+            self._regions[("text", slot)] = text
+            self._track_region(slot, None)
+            self._track_region(slot, rect)
+
+    def _init_layers(self):
+        """Creates the grid overlay (drawn once) and one surface per board."""
+        size = (BOARD_WIDTH * BLOCK_SIZE + 1, BOARD_HEIGHT * BLOCK_SIZE)
+        # Black is transparent, so the grid can be laid over the locked cells
+        self._grid_surface = pygame.Surface(size).convert()
+        self._grid_surface.fill((0, 0, 0))
+        self._grid_surface.set_colorkey((0, 0, 0))
+        self._draw_grid(self._grid_surface, offset_x=0, offset_y=0)
+        self._layers = {1: pygame.Surface(size).convert(), 2: pygame.Surface(size).convert()}
+        self._layer_dirty = {1: True, 2: True}
+        self._regions = {}
+
+    def _rebuild_layer(self, player: int, board_array):
+        """Redraws the locked cells of one board onto its cached layer."""
+        layer = self._layers[player]
+        layer.fill((0, 0, 0))
+        self._draw_cells(layer, board_array, offset_x=0, offset_y=0)
+        layer.blit(self._grid_surface, (0, 0))
+        self._layer_dirty[player] = False
 
     def _handle_player1_keys(self, key):
         # Move left
-        if key == pygame.K_a:
+        if key == PLAYER1_KEYS["left"]:
             self.active_piece1.x -= 1
             if self.check_collision(self.active_piece1, self.board1):
                 self.active_piece1.x += 1
         # Move right
-        elif key == pygame.K_d:
+        elif key == PLAYER1_KEYS["right"]:
             self.active_piece1.x += 1
             if self.check_collision(self.active_piece1, self.board1):
                 self.active_piece1.x -= 1
         # Rotate
-        elif key == pygame.K_w:
-            old_blocks = list(self.active_piece1.blocks)
+        elif key == PLAYER1_KEYS["rotate"]:
             self.active_piece1.rotate()
             if self.check_collision(self.active_piece1, self.board1):
-                self.active_piece1.blocks = old_blocks
+                self.active_piece1.rotate(-1)
         # Soft drop
-        elif key == pygame.K_s:
+        elif key == PLAYER1_KEYS["soft_drop"]:
             self.active_piece1.y += 1
             if self.check_collision(self.active_piece1, self.board1):
                 self.active_piece1.y -= 1
                 self.lock_piece(self.active_piece1, self.board1, player=1)
         # Hard drop
-        elif key == pygame.K_SPACE:
-            while not self.check_collision(self.active_piece1, self.board1):
-                self.active_piece1.y += 1
-            self.active_piece1.y -= 1
+        elif key == PLAYER1_KEYS["hard_drop"]:
+            self.active_piece1.y += self.drop_distance(self.active_piece1, self.board1, player=1)
             self.lock_piece(self.active_piece1, self.board1, player=1)
 
     def _handle_player2_keys(self, key):
         # Move left
-        if key == pygame.K_LEFT:
+        if key == PLAYER2_KEYS["left"]:
             self.active_piece2.x -= 1
             if self.check_collision(self.active_piece2, self.board2):
                 self.active_piece2.x += 1
         # Move right
-        elif key == pygame.K_RIGHT:
+        elif key == PLAYER2_KEYS["right"]:
             self.active_piece2.x += 1
             if self.check_collision(self.active_piece2, self.board2):
                 self.active_piece2.x -= 1
         # Rotate
-        elif key == pygame.K_UP:
-            old_blocks = list(self.active_piece2.blocks)
+        elif key == PLAYER2_KEYS["rotate"]:
             self.active_piece2.rotate()
             if self.check_collision(self.active_piece2, self.board2):
-                self.active_piece2.blocks = old_blocks
+                self.active_piece2.rotate(-1)
         # Soft drop
-        elif key == pygame.K_DOWN:
+        elif key == PLAYER2_KEYS["soft_drop"]:
             self.active_piece2.y += 1
             if self.check_collision(self.active_piece2, self.board2):
                 self.active_piece2.y -= 1
                 self.lock_piece(self.active_piece2, self.board2, player=2)
         # Hard drop
-        elif key == pygame.K_RCTRL:
-            while not self.check_collision(self.active_piece2, self.board2):
-                self.active_piece2.y += 1
-            self.active_piece2.y -= 1
+        elif key == PLAYER2_KEYS["hard_drop"]:
+            self.active_piece2.y += self.drop_distance(self.active_piece2, self.board2, player=2)
             self.lock_piece(self.active_piece2, self.board2, player=2)
 
     def spawn_piece1(self):
-        shape = random.choice(list(TETROMINO_SHAPES.keys()))
+        shape = self.next_shape1
+        self.next_shape1 = self.rng.choice(list(TETROMINO_SHAPES.keys()))
         self.active_piece1 = TetrisPiece(shape, BOARD_WIDTH // 2 - 2, 0)
 
     def spawn_piece2(self):
-        shape = random.choice(list(TETROMINO_SHAPES.keys()))
+        shape = self.next_shape2
+        self.next_shape2 = self.rng.choice(list(TETROMINO_SHAPES.keys()))
         self.active_piece2 = TetrisPiece(shape, BOARD_WIDTH // 2 - 2, 0)
 
     def check_collision(self, piece: TetrisPiece, board_array) -> bool:
+        if isinstance(board_array, TetrisBitBoard):
+            return board_array.collides(piece.blocks, piece.x, piece.y)
         for (bx, by) in piece.get_block_positions():
             if bx < 0 or bx >= BOARD_WIDTH or by < 0 or by >= BOARD_HEIGHT:
                 return True
@@ -233,23 +438,119 @@ class TetrisGame(Game):
                 return True
         return False
 
+    def _mark_layer_rows(self, player: int, top: int, bottom: int):
+        """Flags rows of a player's cached board layer for redraw."""
+        self._layer_dirty[player] = True
+        rows = self._layer_rows[player]
+        self._layer_rows[player] = (top, bottom) if rows is None else (min(rows[0], top), max(rows[1], bottom))
+
+    def column_tops(self, player: int) -> List[int]:
+        """Returns the per-column height profile of a player's board."""
+        return self.column_tops1 if player == 1 else self.column_tops2
+
+    def drop_distance(self, piece: TetrisPiece, board_array, player: int) -> int:
+        """Returns how many rows the piece can fall before it collides."""
+        gap = self._stack_gap(piece, self.column_tops(player))
+        if gap is not None:
+            return gap
+
+        # Piece is tucked under an overhang; the height profile can't answer this
+        distance = 0
+        piece.y += 1
+        while not self.check_collision(piece, board_array):
+            piece.y += 1
+            distance += 1
+        piece.y -= distance + 1
+        return distance
+
+    def ghost_y(self, piece: TetrisPiece, board_array, player: int) -> int:
+        """Returns the row where the piece would land on a hard drop."""
+        return piece.y + self.drop_distance(piece, board_array, player)
+
+    def _stack_gap(self, piece: TetrisPiece, tops: List[int]) -> Optional[int]:
+        """Rows between the piece and the stack below it, or None if the piece isn't fully above the stack."""
+        gap = None
+        for dx, bottom in piece.orientation.col_bottoms:
+            col_gap = tops[piece.x + dx] - (piece.y + bottom) - 1
+            if col_gap < 0:
+                return None
+            if gap is None or col_gap < gap:
+                gap = col_gap
+        return gap
+
+    def _spawn_blocked(self, piece: TetrisPiece, board_array, player: int) -> bool:
+        """Spawn check: a piece fully above the stack can't collide."""
+        if self._stack_gap(piece, self.column_tops(player)) is not None:
+            return False
+        return self.check_collision(piece, board_array)
+
+    def _update_column_tops(self, board_array, player: int):
+        """Recomputes a player's height profile from the board (after rows shift)."""
+        tops = self.column_tops(player)
+        for col in range(BOARD_WIDTH):
+            tops[col] = BOARD_HEIGHT
+        if isinstance(board_array, TetrisBitBoard):
+            seen = 0
+            for row, mask in enumerate(board_array.rows):
+                new = mask & ~seen
+                while new:
+                    low = new & -new
+                    tops[low.bit_length() - 1] = row
+                    new ^= low
+                seen |= mask
+                if seen == board_array.full_row:
+                    break
+        else:
+            for col in range(BOARD_WIDTH):
+                for row in range(BOARD_HEIGHT):
+                    if board_array[row][col] is not None:
+                        tops[col] = row
+                        break
+
     def lock_piece(self, piece: TetrisPiece, board_array, player: int):
         """Locks the piece and checks for game over."""
+        if isinstance(board_array, TetrisBitBoard):
+            board_array.place(piece.blocks, piece.x, piece.y, piece.shape)
+        else:
+            for (bx, by) in piece.get_block_positions():
+                board_array[by][bx] = piece.shape
+        self._mark_layer_rows(player, piece.y + min(dy for _, dy in piece.blocks),
+                              piece.y + max(dy for _, dy in piece.blocks))
+        tops = self.column_tops(player)
         for (bx, by) in piece.get_block_positions():
-            board_array[by][bx] = piece.shape
+            if by < tops[bx]:
+                tops[bx] = by
         self.clear_lines(board_array, player)
 
         if player == 1:
             self.spawn_piece1()
             # Check immediate collision => game over for P1
-            if self.check_collision(self.active_piece1, self.board1):
+            if self._spawn_blocked(self.active_piece1, self.board1, player=1):
                 self.game_over1 = True
         else:
             self.spawn_piece2()
-            if self.check_collision(self.active_piece2, self.board2):
+            if self._spawn_blocked(self.active_piece2, self.board2, player=2):
                 self.game_over2 = True
 
     def clear_lines(self, board_array, player: int):
+        if isinstance(board_array, TetrisBitBoard):
+            lines_cleared = board_array.clear_full_rows()
+        else:
+            lines_cleared = self._clear_list_lines(board_array)
+        if lines_cleared:
+            self._update_column_tops(board_array, player)
+            self._mark_layer_rows(player, 0, BOARD_HEIGHT - 1)
+
+        # Add scoring via player objects
+        if lines_cleared > 0:
+            points = lines_cleared * POINTS_PER_LINE
+            if player == 1:
+                self.player1.updateScore(points)
+            else:
+                self.player2.updateScore(points)
+
+    def _clear_list_lines(self, board_array) -> int:
+        """Clears full rows on a list-of-lists board and returns how many were cleared."""
         lines_cleared = 0
         for row in range(BOARD_HEIGHT):
             if all(board_array[row][col] is not None for col in range(BOARD_WIDTH)):
@@ -258,16 +559,15 @@ class TetrisGame(Game):
                 for r in range(row, 0, -1):
                     board_array[r] = board_array[r - 1][:]
                 board_array[0] = [None for _ in range(BOARD_WIDTH)]
+        return lines_cleared
 
-        # Add scoring via player objects
-        if lines_cleared > 0:
-            points = lines_cleared * 100
-            if player == 1:
-                self.player1.updateScore(points)
-            else:
-                self.player2.updateScore(points)
     def _draw_board(self, board_array, offset_x: int, offset_y: int):
         """Draw locked tiles + optional grid lines."""
+        self._draw_cells(self.screen, board_array, offset_x, offset_y)
+        self._draw_grid(self.screen, offset_x, offset_y)
+
+    def _draw_cells(self, surface, board_array, offset_x: int, offset_y: int):
+        """Draw locked tiles."""
         for y in range(BOARD_HEIGHT):
             for x in range(BOARD_WIDTH):
                 shape = board_array[y][x]
@@ -276,19 +576,20 @@ class TetrisGame(Game):
                     rect = pygame.Rect(offset_x + x * BLOCK_SIZE,
                                        offset_y + y * BLOCK_SIZE,
                                        BLOCK_SIZE, BLOCK_SIZE)
-                    pygame.draw.rect(self.screen, color, rect)
+                    pygame.draw.rect(surface, color, rect)
 
-        # Grid lines
+    def _draw_grid(self, surface, offset_x: int, offset_y: int):
+        """Draw grid lines."""
         for row in range(BOARD_HEIGHT + 1):
             pygame.draw.line(
-                self.screen, (80, 80, 80),
+                surface, (80, 80, 80),
                 (offset_x, offset_y + row * BLOCK_SIZE),
                 (offset_x + BOARD_WIDTH * BLOCK_SIZE, offset_y + row * BLOCK_SIZE),
                 width=1
             )
         for col in range(BOARD_WIDTH + 1):
             pygame.draw.line(
-                self.screen, (80, 80, 80),
+                surface, (80, 80, 80),
                 (offset_x + col * BLOCK_SIZE, offset_y),
                 (offset_x + col * BLOCK_SIZE, offset_y + BOARD_HEIGHT * BLOCK_SIZE),
                 width=1
@@ -305,6 +606,14 @@ class TetrisGame(Game):
             # Outline
             pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
 
+    def _draw_ghost(self, piece: TetrisPiece, ghost_y: int, offset_x: int):
+        """Draw an outline where the active piece would land."""
+        color = SHAPE_COLORS.get(piece.shape, (200, 200, 200))
+        for (dx, dy) in piece.blocks:
+            rect = pygame.Rect(offset_x + (piece.x + dx) * BLOCK_SIZE, (ghost_y + dy) * BLOCK_SIZE,
+                               BLOCK_SIZE, BLOCK_SIZE)
+            pygame.draw.rect(self.screen, color, rect, 2)
+
 if __name__ == "__main__":
     p1 = Player("Alice")
     p2 = Player("Bob")
@@ -0,0 +1,145 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from src.games.tetris import BOARD_WIDTH, BOARD_HEIGHT, TETROMINO_ORIENTATIONS, POINTS_PER_LINE
+
+# Shape index -> name, in TETROMINO_SHAPES order
+SHAPE_NAMES = list(TETROMINO_ORIENTATIONS.keys())
+
+# Block offsets for every (shape, rotation), shape (7, 4, 4)
+ORIENT_DX = np.array([[[dx for dx, _ in o.blocks] for o in TETROMINO_ORIENTATIONS[s]] for s in SHAPE_NAMES], dtype=np.int64)
+ORIENT_DY = np.array([[[dy for _, dy in o.blocks] for o in TETROMINO_ORIENTATIONS[s]] for s in SHAPE_NAMES], dtype=np.int64)
+
+# Legal piece x range for every (shape, rotation)
+MIN_X = -ORIENT_DX.min(axis=2)
+MAX_X = BOARD_WIDTH - 1 - ORIENT_DX.max(axis=2)
+
+# Same spawn position TetrisGame uses
+SPAWN_X = BOARD_WIDTH // 2 - 2
+SPAWN_Y = 0
+
+
+def line_clear_points(points_per_line: int = POINTS_PER_LINE) -> np.ndarray:
+    """Points for clearing 0-4 lines at once, indexed by lines cleared (TetrisGame pays the same per line)."""
+    return np.arange(5, dtype=np.int64) * points_per_line
+
+
+def column_tops(boards: np.ndarray) -> np.ndarray:
+    """Row of the highest filled cell per column, or the board height when empty. (N, H, W) -> (N, W)"""
+    filled = boards.any(axis=1)
+    return np.where(filled, boards.argmax(axis=1), boards.shape[1])
+
+
+def landing_rows(tops: np.ndarray, shapes, rotations, xs) -> np.ndarray:
+    """Row (piece y) where each piece lands when hard dropped straight down from above the stack."""
+    dx = ORIENT_DX[shapes, rotations]
+    dy = ORIENT_DY[shapes, rotations]
+    cols = xs[:, None] + dx
+    rows = np.take_along_axis(tops, cols, axis=1)
+    return (rows - dy).min(axis=1) - 1
+
+
+def place_pieces(boards: np.ndarray, shapes, rotations, xs, ys):
+    """Writes each piece into its board in place."""
+    rows = ys[:, None] + ORIENT_DY[shapes, rotations]
+    cols = xs[:, None] + ORIENT_DX[shapes, rotations]
+    boards[np.arange(len(boards))[:, None], rows, cols] = True
+
+
+def clear_full_rows(boards: np.ndarray) -> np.ndarray:
+    """Removes full rows in place, shifting the rows above down. Returns lines cleared per board."""
+    full = boards.all(axis=2)
+    counts = full.sum(axis=1)
+    hit = np.flatnonzero(counts)
+    if len(hit):
+        # Stable sort moves full rows to the top while keeping the rest in order
+        order = np.argsort(~full[hit], axis=1, kind="stable")
+        shifted = np.take_along_axis(boards[hit], order[:, :, None], axis=1)
+        shifted[np.arange(boards.shape[1])[None, :] < counts[hit][:, None]] = False
+        boards[hit] = shifted
+    return counts
+
+
+def spawn_blocked(boards: np.ndarray, shapes) -> np.ndarray:
+    """True where a freshly spawned piece would overlap locked cells (TetrisGame's game-over rule)."""
+    rows = SPAWN_Y + ORIENT_DY[shapes, 0]
+    cols = SPAWN_X + ORIENT_DX[shapes, 0]
+    return boards[np.arange(len(boards))[:, None], rows, cols].any(axis=1)
+
+
+class TetrisBatch:
+    """Headless Tetris core that steps many independent single-player games at once.
+
+    All boards live in one bool array of shape (games, rows, cols). Each step
+    takes one placement per game (a rotation and a piece x), hard drops the
+    current piece there, clears lines and scores them. Gravity and key timing
+    don't exist at this level, so no window or clock is needed.
+    """
+
+    def __init__(self, n_games: int, seed: Optional[int] = None, points_per_line: int = POINTS_PER_LINE,
+                 width: int = BOARD_WIDTH, height: int = BOARD_HEIGHT):
+        self.n_games = n_games
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.points = line_clear_points(points_per_line)
+
+        self.boards = np.zeros((n_games, height, width), dtype=bool)
+        self.pieces = np.zeros(n_games, dtype=np.int64)
+        self.next_pieces = np.zeros(n_games, dtype=np.int64)
+        self.scores = np.zeros(n_games, dtype=np.int64)
+        self.lines = np.zeros(n_games, dtype=np.int64)
+        self.placements = np.zeros(n_games, dtype=np.int64)
+        self.done = np.zeros(n_games, dtype=bool)
+        self.reset()
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """Starts fresh games, either all of them or only where mask is True."""
+        idx = np.arange(self.n_games) if mask is None else np.flatnonzero(mask)
+        self.boards[idx] = False
+        self.pieces[idx] = self.rng.integers(0, len(SHAPE_NAMES), len(idx))
+        self.next_pieces[idx] = self.rng.integers(0, len(SHAPE_NAMES), len(idx))
+        self.scores[idx] = 0
+        self.lines[idx] = 0
+        self.placements[idx] = 0
+        self.done[idx] = False
+
+    def step(self, rotations, xs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Applies one placement per game and returns (lines_cleared, points, done).
+
+        Out-of-range x values are clamped to the nearest legal column. Games that
+        are already over are left untouched and score nothing.
+        """
+        active = np.flatnonzero(~self.done)
+        lines = np.zeros(self.n_games, dtype=np.int64)
+        points = np.zeros(self.n_games, dtype=np.int64)
+        if not len(active):
+            return lines, points, self.done.copy()
+
+        shapes = self.pieces[active]
+        rotations = np.asarray(rotations, dtype=np.int64)[active] % 4
+        xs = np.clip(np.asarray(xs, dtype=np.int64)[active], MIN_X[shapes, rotations], MAX_X[shapes, rotations])
+        boards = self.boards[active]
+
+        ys = landing_rows(column_tops(boards), shapes, rotations, xs)
+        # A piece that can't fit below the top edge tops the game out
+        topped_out = ys + ORIENT_DY[shapes, rotations].min(axis=1) < 0
+        fits = ~topped_out
+        placed = boards[fits]
+        place_pieces(placed, shapes[fits], rotations[fits], xs[fits], ys[fits])
+        cleared = clear_full_rows(placed)
+
+        live = active[fits]
+        self.boards[live] = placed
+        lines[live] = cleared
+        points[live] = self.points[cleared]
+        self.scores += points
+        self.lines += lines
+        self.placements[live] += 1
+
+        # Advance the piece queue and apply TetrisGame's spawn-collision game over
+        self.pieces[active] = self.next_pieces[active]
+        self.next_pieces[active] = self.rng.integers(0, len(SHAPE_NAMES), len(active))
+        blocked = spawn_blocked(self.boards[active], self.pieces[active])
+        self.done[active] = topped_out | blocked
+        return lines, points, self.done.copy()
@@ -0,0 +1,67 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def piece_masks(blocks: Tuple[Tuple[int, int], ...]) -> Tuple[int, int, Tuple[Tuple[int, int], ...]]:
+    """Returns (min_dx, max_dx, ((dy, row_mask), ...)) for a block layout.
+
+    Row masks are relative to min_dx, so a piece at x is placed by shifting
+    each mask left by x + min_dx.
+    """
+    min_dx = min(dx for dx, _ in blocks)
+    max_dx = max(dx for dx, _ in blocks)
+    rows = {}
+    for dx, dy in blocks:
+        rows[dy] = rows.get(dy, 0) | (1 << (dx - min_dx))
+    return min_dx, max_dx, tuple(sorted(rows.items()))
+
+
+class TetrisBitBoard:
+    """Tetris board stored as one integer bitmask per row.
+
+    Bit x of rows[y] is set when cell (x, y) is occupied. Shape names live in a
+    separate color plane that is only read when rendering.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows: List[int] = [0] * height
+        self.colors: List[List[Optional[str]]] = [[None] * width for _ in range(height)]
+
+    def collides(self, blocks, x: int, y: int) -> bool:
+        """Checks if a piece with the given blocks at (x, y) hits a wall or a locked cell."""
+        min_dx, max_dx, row_masks = piece_masks(tuple(blocks))
+        if x + min_dx < 0 or x + max_dx >= self.width:
+            return True
+        shift = x + min_dx
+        for dy, mask in row_masks:
+            row = y + dy
+            if row < 0 or row >= self.height or self.rows[row] & (mask << shift):
+                return True
+        return False
+
+    def place(self, blocks, x: int, y: int, shape: str):
+        """Locks a piece into the row masks and records its shape in the color plane."""
+        min_dx, _, row_masks = piece_masks(tuple(blocks))
+        shift = x + min_dx
+        for dy, mask in row_masks:
+            self.rows[y + dy] |= mask << shift
+        for dx, dy in blocks:
+            self.colors[y + dy][x + dx] = shape
+
+    def clear_full_rows(self) -> int:
+        """Removes every full row, shifts the rest down and returns the number cleared."""
+        full_row = self.full_row
+        keep = [i for i, row in enumerate(self.rows) if row != full_row]
+        cleared = self.height - len(keep)
+        if cleared:
+            self.rows = [0] * cleared + [self.rows[i] for i in keep]
+            self.colors = [[None] * self.width for _ in range(cleared)] + [self.colors[i] for i in keep]
+        return cleared
+
+    def __getitem__(self, row: int):
+        """Row access mirrors the list-of-lists board so rendering code can index it."""
+        return self.colors[row]
@@ -0,0 +1,174 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from src.games.tetris import PLAYER1_KEYS, PLAYER2_KEYS, TETROMINO_ORIENTATIONS, TetrisPiece
+from src.games.tetris_bitboard import TetrisBitBoard
+from src.games.tetris_batch import (SHAPE_NAMES, MIN_X, MAX_X, ORIENT_DY,
+                                    column_tops, landing_rows, place_pieces, clear_full_rows)
+
+SHAPE_INDEX = {name: i for i, name in enumerate(SHAPE_NAMES)}
+
+# Rotations that give distinct block sets (O has one, I/S/Z have two)
+DISTINCT_ROTATIONS = {}
+for _name, _orientations in TETROMINO_ORIENTATIONS.items():
+    _seen = {}
+    for _r, _o in enumerate(_orientations):
+        _min_dx = min(dx for dx, _ in _o.blocks)
+        _min_dy = min(dy for _, dy in _o.blocks)
+        _seen.setdefault(frozenset((dx - _min_dx, dy - _min_dy) for dx, dy in _o.blocks), _r)
+    DISTINCT_ROTATIONS[_name] = sorted(_seen.values())
+
+# Every (rotation, x) a piece can be hard dropped at from above the stack
+ALL_PLACEMENTS = {
+    name: np.array([(r, x) for r in DISTINCT_ROTATIONS[name]
+                    for x in range(MIN_X[i, r], MAX_X[i, r] + 1)], dtype=np.int64)
+    for i, name in enumerate(SHAPE_NAMES)
+}
+
+
+def board_to_array(board_array) -> np.ndarray:
+    """Converts a TetrisGame board (list of lists or TetrisBitBoard) to an (H, W) bool array."""
+    if isinstance(board_array, TetrisBitBoard):
+        rows = np.array(board_array.rows, dtype=np.int64)
+        return (rows[:, None] >> np.arange(board_array.width)) & 1 == 1
+    return np.array([[cell is not None for cell in row] for row in board_array], dtype=bool)
+
+
+def board_features(boards: np.ndarray) -> np.ndarray:
+    """Returns (aggregate height, holes, bumpiness) per board as an (N, 3) array."""
+    heights = boards.shape[1] - column_tops(boards)
+    covered = np.cumsum(boards, axis=1) > 0
+    holes = (covered & ~boards).sum(axis=(1, 2))
+    bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+    return np.stack([heights.sum(axis=1), holes, bumpiness], axis=1)
+
+
+def drop_all(boards: np.ndarray, shape: str, placements: np.ndarray):
+    """Drops one piece at every placement on every board.
+
+    Returns (result boards, lines cleared, topped out), each with
+    len(boards) * len(placements) rows, grouped by board.
+    """
+    n_boards, n_place = len(boards), len(placements)
+    results = np.repeat(boards, n_place, axis=0)
+    shapes = np.full(n_boards * n_place, SHAPE_INDEX[shape])
+    rotations = np.tile(placements[:, 0], n_boards)
+    xs = np.tile(placements[:, 1], n_boards)
+
+    ys = landing_rows(column_tops(results), shapes, rotations, xs)
+    topped_out = ys + ORIENT_DY[shapes, rotations].min(axis=1) < 0
+    fits = ~topped_out
+    placed = results[fits]
+    place_pieces(placed, shapes[fits], rotations[fits], xs[fits], ys[fits])
+    lines = np.zeros(len(results), dtype=np.int64)
+    lines[fits] = clear_full_rows(placed)
+    results[fits] = placed
+    return results, lines, topped_out
+
+
+class TetrisBot:
+    """AI player for TetrisGame that searches every final placement of its piece.
+
+    Candidates (optionally paired with every placement of the next piece) are
+    scored together in one NumPy pass on aggregate height, holes, bumpiness and
+    lines cleared. The bot plans once per piece, then presses one key per frame
+    through the same key handlers a human uses.
+    """
+
+    # Weights for (lines cleared, aggregate height, holes, bumpiness)
+    DEFAULT_WEIGHTS = (0.760666, -0.510066, -0.35663, -0.184483)
+
+    def __init__(self, weights: Optional[Tuple[float, float, float, float]] = None, lookahead: bool = True):
+        self.weights = np.array(weights if weights else self.DEFAULT_WEIGHTS, dtype=float)
+        self.lookahead = lookahead
+        self._piece = None
+        self._target = None
+        self._drop_to = 0
+        self._last_state = None
+
+    def choose_placement(self, board: np.ndarray, piece: TetrisPiece,
+                         next_shape: Optional[str] = None, reachable=None) -> Optional[Tuple[int, int]]:
+        """Returns the best (rotation, x) for the piece on an (H, W) bool board, or None if every move tops out."""
+        placements = ALL_PLACEMENTS[piece.shape]
+        if reachable is not None:
+            placements = placements[[(int(r), int(x)) in reachable for r, x in placements]]
+        if not len(placements):
+            return None
+
+        first, lines, topped_out = drop_all(board[None], piece.shape, placements)
+        w_lines, w_feat = self.weights[0], self.weights[1:]
+        if self.lookahead and next_shape:
+            second_placements = ALL_PLACEMENTS[next_shape]
+            second, lines2, topped_out2 = drop_all(first, next_shape, second_placements)
+            scores = board_features(second) @ w_feat + w_lines * (np.repeat(lines, len(second_placements)) + lines2)
+            scores[topped_out2 | np.repeat(topped_out, len(second_placements))] = -np.inf
+            scores = scores.reshape(len(placements), len(second_placements)).max(axis=1)
+        else:
+            scores = board_features(first) @ w_feat + w_lines * lines
+            scores[topped_out] = -np.inf
+
+        best = int(np.argmax(scores))
+        if scores[best] == -np.inf:
+            return None
+        return int(placements[best, 0]), int(placements[best, 1])
+
+    def reachable_placements(self, game, piece: TetrisPiece, board_array):
+        """Returns ((rotation, x) pairs the piece can reach, row to soft drop to first).
+
+        Fresh pieces spawn against the ceiling where most rotations don't fit,
+        so the bot first soft drops far enough for every orientation to clear it.
+        """
+        clearance = -min(dy for o in TETROMINO_ORIENTATIONS[piece.shape] for _, dy in o.blocks)
+        start_y = max(piece.y, clearance)
+        probe = TetrisPiece(piece.shape, piece.x, start_y, piece.rotation)
+        if game.check_collision(probe, board_array):
+            start_y = probe.y = piece.y
+
+        reachable = set()
+        for turns in range(4):
+            if turns and game.check_collision(probe, board_array):
+                break
+            for step in (-1, 1):
+                probe.x = piece.x
+                while not game.check_collision(probe, board_array):
+                    reachable.add((probe.rotation, probe.x))
+                    probe.x += step
+            probe.x = piece.x
+            probe.rotate()
+        return reachable, start_y
+
+    def plan(self, game, player: int):
+        """Picks a target placement for the player's current piece."""
+        piece = game.active_piece1 if player == 1 else game.active_piece2
+        board_array = game.board1 if player == 1 else game.board2
+        next_shape = game.next_shape1 if player == 1 else game.next_shape2
+        reachable, self._drop_to = self.reachable_placements(game, piece, board_array)
+        self._piece = piece
+        self._target = self.choose_placement(board_to_array(board_array), piece, next_shape, reachable)
+        self._last_state = None
+
+    def next_key(self, game, player: int) -> Optional[int]:
+        """Returns the key to press this frame, planning first if a new piece spawned."""
+        keys = PLAYER1_KEYS if player == 1 else PLAYER2_KEYS
+        piece = game.active_piece1 if player == 1 else game.active_piece2
+        if piece is not self._piece:
+            self.plan(game, player)
+        if self._target is None:
+            return keys["hard_drop"]
+
+        state = (piece.rotation, piece.x, piece.y)
+        if state == self._last_state:
+            # The last move was blocked; place the piece where it is
+            return keys["hard_drop"]
+        self._last_state = state
+
+        rotation, x = self._target
+        if piece.y < self._drop_to:
+            return keys["soft_drop"]
+        if piece.rotation != rotation:
+            return keys["rotate"]
+        if piece.x > x:
+            return keys["left"]
+        if piece.x < x:
+            return keys["right"]
+        return keys["hard_drop"]
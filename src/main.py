@@ -1,30 +1,56 @@
+import argparse
+import atexit
 import pygame
 from src.ui.screen_manager import ScreenManager
 from src.ui.main_menu_screen import MainMenu
 from src.ui.game_selection_screen import GameSelectionScreen
 from src.ui.login_screen import LoginScreen
 from src.ui.scores_screen import scoresScreen
+from src.ui.splash_screen import SplashScreen
 from src.engines.game_engine import GameEngine
+from src.engines.game_registry import GAMES
+from src.engines.warmup import AssetWarmup
+from src.engines.sampling_profiler import sampling_profiler
 
-def main():
+def create_arcade():
+    """Sets up pygame and the screens and shows the splash screen; returns the ScreenManager to run."""
     pygame.init()
     screen_manager = ScreenManager()
     engine = GameEngine(screen_manager)
 
-    # Create screens
-    main_menu = MainMenu(screen_manager, engine)
-    game_selection = GameSelectionScreen(screen_manager, engine)
-    login_screen = LoginScreen(screen_manager, engine)
-    scores = scoresScreen(screen_manager, engine)
+    # Screens are built the first time they're shown
+    screen_manager.register_screen("main_menu", lambda: MainMenu(screen_manager, engine))
+    screen_manager.register_screen("game_selection", lambda: GameSelectionScreen(screen_manager, engine))
+    screen_manager.register_screen("login", lambda: LoginScreen(screen_manager, engine))
+    screen_manager.register_screen("scores", lambda: scoresScreen(screen_manager, engine))
+
+    # Splash screen while the menus and games warm up, most urgent first
+    warmup = AssetWarmup()
+    def add_screen_warmup(name):
+        warmup.add(name.replace("_", " "), lambda: screen_manager.get_screen(name).warm_up())
+    add_screen_warmup("main_menu")
+    add_screen_warmup("game_selection")
+    for entry in GAMES.values():
+        warmup.add(entry.title, entry.warm_up)
+    add_screen_warmup("scores")
+    add_screen_warmup("login")
+    screen_manager.push(SplashScreen(screen_manager, warmup))
+    return screen_manager
 
-    # Add screens to manager
-    screen_manager.add_screen("main_menu", main_menu)
-    screen_manager.add_screen("game_selection", game_selection)
-    screen_manager.add_screen("login", login_screen)
-    screen_manager.add_screen("scores", scores)
 
-    screen_manager.set_screen("main_menu")
+def main():
+    parser = argparse.ArgumentParser(description="TMGE Arcade")
+    parser.add_argument("--profile", action="store_true",
+                        help="sample the whole session (F9 toggles it at any time) and write "
+                             "flamegraph stacks to profiling/ on exit")
+    args = parser.parse_args()
+    if args.profile:
+        sampling_profiler.start()
+    atexit.register(sampling_profiler.stop)  # Writes the profile if one is still running
+
+    screen_manager = create_arcade()
     screen_manager.run()
+    pygame.quit()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,38 +1,97 @@
 import pygame
-import os
 from abc import ABC, abstractmethod
+from src.engines.dirty_regions import DirtyRegions
+from src.engines.resource_cache import get_font, render_text
+from src.ui.scene import Scene
 
-class BaseScreen(ABC):
-    """Abstract base class for all screens in the game."""
+
+class BaseScreen(Scene, ABC):
+    """Abstract base class for all screens in the game.
+
+    Screens are event-driven scenes: they are redrawn only when a button's
+    hover state, input (handle_event returning True) or data_key() changes.
+    """
 
     def __init__(self, screen_manager):
-        pygame.init()
-        self.screen_manager = screen_manager
+        super().__init__(screen_manager)
         self.WIDTH, self.HEIGHT = 1200, 800
-        self.screen = pygame.display.set_mode((1200, 800))
-        self.running = False
+        self.size = (self.WIDTH, self.HEIGHT)
+        # Screens report changed rects; present() pushes only those to the display
+        self.dirty = DirtyRegions()
+        self.buttons = []
+        self._data = None
 
         # FONTS
         self.title_font = self.load_font("Starborn.ttf", 100)
         self.button_font = self.load_font("Straw Milky.otf", 30)
-        self.default_font = pygame.font.Font(None, 30)
-    
+        self.default_font = get_font(None, 30)
+
 
     def load_font(self, file_name, size):
-        """Load a font from the given path and size."""
-        font_path = os.path.join("assets", "fonts", file_name)
-        if os.path.exists(font_path):
-            return pygame.font.Font(font_path, size)
-        else:
-            print(f"Font not found at {font_path}; using default font.")
-            return pygame.font.Font(None, size)
+        """Load a font from assets/fonts (shared with every other screen through the resource cache)."""
+        return get_font(file_name, size)
+
+    def warm_up(self):
+        """Pre-renders the button labels (the splash screen runs this on a worker thread)."""
+        for button in self.buttons:
+            render_text(button.font, button.text, (255, 255, 255))
+
+    def enter(self):
+        super().enter()
+        self.dirty.add_all()
+        self._data = self.data_key()
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.screen_manager.quit()
+                return
+            if event.type == pygame.MOUSEMOTION:
+                if any(button.hover_changed(event.pos) for button in self.buttons):
+                    self.needs_redraw = True
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                self.dirty.add_all()
+                self.needs_redraw = True
+            if self.handle_event(event):
+                self.needs_redraw = True
+            if self.screen_manager.current_screen is not self:
+                return  # A button switched screens; the rest of the events aren't ours
+
+    def handle_event(self, event):
+        """Screen-specific input; returns True if the screen needs a redraw. Buttons by default."""
+        for button in self.buttons:
+            button.check_click(event)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.dirty.add_all()  # A click may have changed data; draw everything
+            return True
+        return False
+
+    def data_key(self):
+        """Anything that changes when the screen's data does; the screen redraws when it changes."""
+        return None
+
+    def update(self, dt):
+        data = self.data_key()
+        if data != self._data:
+            self._data = data
+            self.dirty.add_all()
+            self.needs_redraw = True
+
+    def render(self):
+        self.draw()
+        self.needs_redraw = False
+
+    def draw_buttons(self):
+        """Draws every button and marks it changed; after the first frame only buttons change (hover)."""
+        for button in self.buttons:
+            button.draw(self.screen)
+            self.dirty.add(button.rect)
+
+    def present(self):
+        """Update the display with the regions changed this frame."""
+        self.dirty.present()
 
     @abstractmethod
     def draw(self):
         """Abstract method to draw the screen. Each screen must have its own drawing method."""
         pass
-
-    @abstractmethod
-    def run(self):
-        """Abstract method to run the screen. Each screen must have its own event loop."""
-        pass
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+from src.engines.resource_cache import render_text
 
 class Button:
     def __init__(self, x, y, width, height, text, font, color, hover_color, action):
@@ -8,20 +9,26 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.action = action
+        self.hovered = False  # As of the last draw
     
     def draw(self, screen):
         mouse_pos = pygame.mouse.get_pos()
 
-        if self.rect.collidepoint(mouse_pos):
+        self.hovered = self.rect.collidepoint(mouse_pos)
+        if self.hovered:
             pygame.draw.rect(screen, self.hover_color, self.rect, border_radius=10)
         else:
             pygame.draw.rect(screen, self.color, self.rect, border_radius=10)
 
-        text_surf = self.font.render(self.text, True, (255, 255, 255))
+        text_surf = render_text(self.font, self.text, (255, 255, 255))
         text_rect = text_surf.get_rect(center=self.rect.center)
         text_rect.y += 5   # Offset for text centering due to font
         screen.blit(text_surf, text_rect)
     
+    def hover_changed(self, pos):
+        """True if the mouse at pos would draw the button differently than last time."""
+        return self.rect.collidepoint(pos) != self.hovered
+
     def check_click(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos):
             if self.action:
@@ -1,9 +1,12 @@
 import pygame
 import os
+from src.engines.resource_cache import render_text
 from .base_screen import BaseScreen
 from .button import Button
 
 class GameSelectionScreen(BaseScreen):
+    caption = "Select a Game"
+
     def __init__(self, screen_manager, game_engine):
         super().__init__(screen_manager)
         self.game_engine = game_engine
@@ -19,29 +22,14 @@ class GameSelectionScreen(BaseScreen):
         self.screen.fill((191, 88, 171))  # Background Color
 
         # Draw Title
-        title_text = self.title_font.render("Select a Game", True, (25, 169, 252))
+        title_text = render_text(self.title_font, "Select a Game", (25, 169, 252))
         self.screen.blit(title_text, (self.WIDTH // 2 - title_text.get_width() // 2, 150))
 
         # Draw Buttons
-        for button in self.buttons:
-            button.draw(self.screen)
-
-        pygame.display.flip()
-
-    def run(self):
-        self.running = True
-        pygame.display.set_caption("Select a Game")
-        while self.running:
-            self.draw()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                for button in self.buttons:
-                    button.check_click(event)
-
-        return
-    
+        self.draw_buttons()
+
+        self.present()
+
     def go_back(self):
         """Return to Main Menu screen"""
-        self.running = False
         self.screen_manager.set_screen("main_menu")
\ No newline at end of file
@@ -1,9 +1,12 @@
 import pygame
 import os
+from src.engines.resource_cache import render_text
 from .base_screen import BaseScreen
 from .button import Button
 
 class MainMenu(BaseScreen):
+    caption = "Main Menu"
+
     def __init__(self, screen_manager, game_engine):
         super().__init__(screen_manager)
         self.game_engine = game_engine
@@ -20,28 +23,15 @@ class MainMenu(BaseScreen):
         self.screen.fill((191, 88, 171))  # Background Color
 
         # Draw Title
-        title_text = self.title_font.render("TMGE Arcade", True, (25, 169, 252))
+        title_text = render_text(self.title_font, "TMGE Arcade", (25, 169, 252))
         self.screen.blit(title_text, (self.WIDTH // 2 - title_text.get_width() // 2, 150))
 
         # Draw buttons
-        for button in self.buttons:
-            button.draw(self.screen)
+        self.draw_buttons()
         
-        pygame.display.flip()
-
-    def run(self):
-        self.running = True
-        pygame.display.set_caption("Main Menu")
-        while self.running:
-            self.draw()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                for button in self.buttons:
-                    button.check_click(event)
+        self.present()
 
     def exit_game(self):
         """Terminate Application"""
         print("Exiting Game...")
-        pygame.quit()
-        exit()
\ No newline at end of file
+        self.screen_manager.quit()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import pygame
+
+
+class Scene:
+    """One entry on the ScreenManager's stack. Only the top scene gets frames.
+
+    The manager's loop calls, once per frame:
+      begin_frame(), handle_events(events), update(dt), render(), end_frame(dt)
+    Scenes with fps=None are event-driven: the loop sleeps until an event
+    arrives and only renders them when needs_redraw is set.
+    """
+    size = (1200, 800)  # Display size the scene draws for
+    caption = "TMGE Arcade"
+    fps = None  # Frames per second, or None for event-driven
+
+    def __init__(self, screen_manager):
+        self.screen_manager = screen_manager
+        self.needs_redraw = True
+
+    @property
+    def screen(self):
+        """The shared display surface."""
+        return pygame.display.get_surface()
+
+    def enter(self):
+        """Called when the scene becomes the top of the stack (pushed, or uncovered by a pop)."""
+        self.screen_manager.ensure_display(self.size)
+        pygame.display.set_caption(self.caption)
+        self.needs_redraw = True
+
+    def exit(self):
+        """Called when the scene leaves the top of the stack."""
+        pass
+
+    def begin_frame(self):
+        pass
+
+    def handle_events(self, events):
+        """QUIT closes the arcade by default."""
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.screen_manager.quit()
+
+    def update(self, dt):
+        """dt: seconds the previous frame took (0 right after a transition)."""
+        pass
+
+    def render(self):
+        self.needs_redraw = False
+
+    def end_frame(self, dt):
+        pass
+
+
+class GameScene(Scene):
+    """Runs a Game inside the arcade's frame loop, then pops itself when the game stops."""
+    fps = 60
+
+    def __init__(self, screen_manager, game, recorder=None, on_finish=None):
+        """
+        recorder: ReplayRecorder for the match, or None.
+        on_finish: called with the game after it ends and the scene has been popped.
+        """
+        super().__init__(screen_manager)
+        self.game = game
+        self.recorder = recorder
+        self.on_finish = on_finish
+        self.size = game.display_size
+        self.caption = game.caption
+        self.started = False
+
+    def enter(self):
+        super().enter()
+        self.game.dirty.add_all()
+        if not self.started:
+            self.game.start_loop(self.fps, self.recorder)
+            self.started = True
+
+    def begin_frame(self):
+        self.game.profiler.start_frame()
+
+    def handle_events(self, events):
+        self.game.process_events(events)  # QUIT ends the match, not the arcade
+
+    def update(self, dt):
+        # Like run_game_loop, the frame a QUIT arrives in is still simulated, so replays see it too
+        self.game.advance()
+        if not self.game.running:
+            self.game.end_frame(self.game.frame_ms)  # Count the last frame before the footer is written
+            self.game.finish_loop()
+            self.screen_manager.pop()
+            if self.on_finish:
+                self.on_finish(self.game)
+
+    def render(self):
+        self.game.draw_frame(self.screen)
+
+    def end_frame(self, dt):
+        self.game.end_frame(round(dt * 1000))
@@ -1,8 +1,15 @@
 import pygame
+from src.engines.resource_cache import get_font, render_text
 from .base_screen import BaseScreen
 from .button import Button
 
+# Rows that fit between the title and the Back button
+SCORE_ROWS = 7
+
+
 class scoresScreen(BaseScreen):
+    caption = "High Scores"
+
     def __init__(self, screen_manager, engine):
         super().__init__(screen_manager)
         self.game_engine = engine
@@ -18,7 +25,7 @@ class scoresScreen(BaseScreen):
         self.screen.fill((191, 88, 171))  # Background Color
 
         # Draw Title
-        title_text = self.title_font.render("High Scores", True, (25, 169, 252))
+        title_text = render_text(self.title_font, "High Scores", (25, 169, 252))
         self.screen.blit(title_text, (self.WIDTH // 2 - title_text.get_width() // 2, 100))
 
         # Display name and score(s) THIS IS FOR ONE PLAYER ONLY
@@ -28,32 +35,22 @@ class scoresScreen(BaseScreen):
         #p1_text = score_font.render(p1_text_str, True, (255, 255, 255))
         #self.screen.blit(p1_text, (self.WIDTH // 2 - p1_text.get_width() // 2, 250))
 
-        profiles = self.game_engine.profile_manager.profiles
-        score_font = pygame.font.Font(None, 40)
+        score_font = get_font(None, 40)
         y_offset = 300  # starting y-position for scores
 
-        for name, data in profiles.items():
-            score_text = score_font.render(f"{name}: {data['score']}", True, (255, 255, 255))
+        for name, score in self._data:
+            score_text = render_text(score_font, f"{name}: {score}", (255, 255, 255))
             self.screen.blit(score_text, (self.WIDTH // 2 - score_text.get_width() // 2, y_offset))
             y_offset += 40
 
         # Draw Button
-        for button in self.buttons:
-            button.draw(self.screen)
-        pygame.display.flip()
-    
-    def run(self):
-        self.running = True
-        pygame.display.set_caption("High Scores")
-        while self.running:
-            self.draw()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                for button in self.buttons:
-                    button.check_click(event)
+        self.draw_buttons()
+        self.present()
     
+    def data_key(self):
+        """The scores shown; redraw when one changes (e.g. saved by another session)."""
+        return tuple(self.game_engine.profile_manager.top_scores(SCORE_ROWS))
+
     def go_back(self):
         """Return to Main Menu screen"""
-        self.running = False
         self.screen_manager.set_screen("main_menu")
\ No newline at end of file
@@ -1,21 +1,109 @@
+import threading
+import pygame
+from src.engines.sampling_profiler import sampling_profiler
+
+# Event-driven scenes sleep in pygame.event.wait; they still wake this often to notice data changes
+IDLE_TIMEOUT_MS = 500
+# Redraws per second at most for event-driven scenes while something keeps changing
+MAX_FPS = 60
+
+
 class ScreenManager:
+    """Keeps the scene stack and runs the arcade's only frame loop.
+
+    Menus replace each other with set_screen, so the stack stays one scene
+    deep; games are pushed on top of the menu that started them and pop
+    themselves when they end. The display is created once and only re-created
+    when a scene needs a different size.
+    """
+
     def __init__(self):
-        self.screens = {}   # Store all screens
-        self.current_screen = None  # The active screen
+        self.screens = {}   # Named scenes (menus) that have been built
+        self.factories = {}  # Named scenes not shown yet: name -> callable that builds it
+        self.stack = []
+        self.display_modes = 0  # How often the display was (re)created
+        self._build_lock = threading.Lock()  # The splash screen's warm-up thread builds screens too
+
+    @property
+    def current_screen(self):
+        return self.stack[-1] if self.stack else None
 
     def add_screen(self, name, screen):
         self.screens[name] = screen
 
+    def register_screen(self, name, factory):
+        """Adds a named scene that is only built (fonts, buttons) the first time it's shown."""
+        self.factories[name] = factory
+
+    def get_screen(self, name):
+        with self._build_lock:
+            screen = self.screens.get(name)
+            if screen is None:
+                # The factory is only dropped once it has built the screen, so a failed build can be retried
+                screen = self.screens[name] = self.factories[name]()
+                del self.factories[name]
+            return screen
+
     def set_screen(self, name):
-        """Switches to the new screen, terminating the last one."""
-        if self.current_screen:
-            self.current_screen.running = False  # Stop current screen loop
+        """Replaces the top scene with a named one."""
+        screen = self.get_screen(name)
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(screen)
+
+    def push(self, scene):
+        if self.stack:
+            self.stack[-1].exit()
+        self.stack.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """Removes the top scene and resumes the one under it."""
+        self.stack.pop().exit()
+        if self.stack:
+            self.stack[-1].enter()
 
-        self.current_screen = self.screens.get(name)
-        if self.current_screen:
-            self.current_screen.running = True  # Ensure new screen runs
+    def quit(self):
+        """Empties the stack, which ends run()."""
+        while self.stack:
+            self.stack.pop().exit()
+
+    def ensure_display(self, size):
+        """Returns the display surface, re-creating it only if its size has to change."""
+        surface = pygame.display.get_surface()
+        if surface is None or surface.get_size() != tuple(size):
+            surface = pygame.display.set_mode(size)
+            self.display_modes += 1
+        return surface
 
     def run(self):
-        """Runs the active screen."""
-        while self.current_screen:
-            self.current_screen.run()
+        """Runs frames for the top scene until the stack is empty."""
+        clock = pygame.time.Clock()
+        dt = 0.0
+        while self.stack:
+            scene = self.stack[-1]
+            scene.begin_frame()
+            if scene.fps or scene.needs_redraw:
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait(IDLE_TIMEOUT_MS)] + pygame.event.get()
+            # F9 works everywhere and belongs to the sampling profiler
+            events = [event for event in events
+                      if event.type != pygame.NOEVENT and not sampling_profiler.handle_hotkey(event)]
+
+            scene.handle_events(events)
+            if self.current_screen is scene:
+                scene.update(dt)
+            if self.current_screen is not scene:
+                # Transition; the next scene starts fresh, and its first tick measures from here, not from
+                # the last frame the old scene rendered
+                clock.tick()
+                dt = 0.0
+                continue
+
+            if scene.fps or scene.needs_redraw:
+                scene.render()
+                dt = clock.tick(scene.fps or MAX_FPS) / 1000
+                scene.end_frame(dt)
+            else:
+                dt = 0.0
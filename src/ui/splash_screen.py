@@ -0,0 +1,54 @@
+import pygame
+from src.engines.resource_cache import get_font, render_text
+from src.ui.scene import Scene
+
+
+class SplashScreen(Scene):
+    """Shows warm-up progress, then switches to the first real screen once everything is loaded.
+
+    It only uses pygame's built-in font, so it can draw before any asset is ready.
+    """
+    caption = "TMGE Arcade"
+    fps = 30
+
+    def __init__(self, screen_manager, warmup, next_screen="main_menu"):
+        """
+        warmup: AssetWarmup with its tasks added; started when the splash is shown.
+        next_screen: named screen to show when the warm-up is done.
+        """
+        super().__init__(screen_manager)
+        self.warmup = warmup
+        self.next_screen = next_screen
+        self.WIDTH, self.HEIGHT = self.size
+        self.title_font = get_font(None, 80)
+        self.status_font = get_font(None, 30)
+
+    def enter(self):
+        super().enter()
+        self.warmup.start()
+
+    def update(self, dt):
+        if self.warmup.finished.is_set():
+            self.screen_manager.set_screen(self.next_screen)
+
+    def render(self):
+        screen = self.screen
+        screen.fill((191, 88, 171))  # Same background as the menus
+        title = render_text(self.title_font, "TMGE Arcade", (25, 169, 252))
+        screen.blit(title, (self.WIDTH // 2 - title.get_width() // 2, 250))
+
+        # Progress bar
+        bar = pygame.Rect(300, 450, self.WIDTH - 600, 30)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2, border_radius=8)
+        filled = bar.inflate(-8, -8)
+        filled.width = int(filled.width * self.warmup.progress)
+        if filled.width > 0:
+            pygame.draw.rect(screen, (25, 169, 252), filled, border_radius=6)
+
+        status = f"Loading {self.warmup.current}..." if self.warmup.current else "Ready"
+        # Through the cache, whose lock keeps this off the fonts the worker is loading
+        text = render_text(self.status_font, status, (255, 255, 255))
+        screen.blit(text, (self.WIDTH // 2 - text.get_width() // 2, 500))
+
+        pygame.display.flip()
+        self.needs_redraw = False
@@ -0,0 +1,16 @@
+import os
+
+import pygame
+import pytest
+
+# Games open windows; run them without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture(scope="session")
+def display():
+    """pygame, initialized once: fonts and surfaces the games cache must outlive each test."""
+    pygame.init()
+    yield
+    pygame.quit()
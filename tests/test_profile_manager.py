@@ -0,0 +1,55 @@
+import multiprocessing
+
+from src.engines.game_engine import GameEngine
+from src.engines.player import Player
+from src.engines.profile_manager import ProfileManager
+
+
+def log_in(manager, name, slot):
+    """What the login screen does for one player slot."""
+    player = Player(name)
+    player.score = manager.get_profile(name, slot=slot)["score"]
+    return player
+
+
+def test_same_profile_in_both_slots_keeps_both_saves(tmp_path):
+    manager = ProfileManager(str(tmp_path / "profiles.db"), None)
+    manager.get_profile("al")
+    manager.update_profile_score("al", 50)
+
+    engine = GameEngine(None, replay_dir=None)
+    engine.profile_manager = manager
+    engine.set_player(log_in(manager, "al", 1), log_in(manager, "al", 2))
+    engine.save_scores(50 + 20, 50 + 30)
+
+    assert manager.get_profile("al")["score"] == 100
+    assert engine.player1.score == 70  # Saved first, before slot 2's points were in
+    assert engine.player2.score == 100
+    manager.close()
+
+
+def cabinet(filename, updates, logged_in):
+    """One arcade process; every cabinet logs in before any saves, so all but one start from a stale score."""
+    manager = ProfileManager(filename, None)
+    score = manager.get_profile("shared")["score"]
+    logged_in.wait()
+    for _ in range(updates):
+        score = manager.update_profile_score("shared", score + 1)
+    manager.close()
+
+
+def test_concurrent_writers_lose_no_points(tmp_path):
+    filename = str(tmp_path / "profiles.db")
+    manager = ProfileManager(filename, None)
+    before = manager.get_profile("shared")["score"]
+
+    logged_in = multiprocessing.Barrier(2)
+    workers = [multiprocessing.Process(target=cabinet, args=(filename, 100, logged_in)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert manager.get_profile("shared")["score"] - before == 2 * 100
+    manager.close()
@@ -0,0 +1,117 @@
+import random
+
+import pygame
+import pytest
+
+from src.engines.player import Player
+from src.engines.replay import ReplayPlayer, ReplayRecorder
+from src.ui.scene import GameScene
+from src.ui.screen_manager import ScreenManager
+
+
+class FakeClock:
+    """Stands in for pygame.time.Clock: returns uneven frame times without sleeping."""
+
+    def __init__(self):
+        self.random = random.Random(3)
+
+    def tick(self, fps=0):
+        return self.random.choice([16, 17, 17, 33, 120])
+
+
+def scripted_input(game_name, frames, seed=7):
+    """Replaces pygame.event.get with random play that quits after the given number of frames."""
+    rng = random.Random(seed)
+    count = [0]
+
+    def get():
+        count[0] += 1
+        if count[0] > frames:
+            # Input in the same frame as the QUIT still counts, so the last frame must replay too
+            return next_input() + [pygame.event.Event(pygame.QUIT)]
+        return next_input()
+
+    def next_input():
+        if game_name == "tetris":
+            from src.games.tetris import PLAYER1_KEYS, PLAYER2_KEYS
+            if rng.random() < 0.3:
+                key = rng.choice(list(PLAYER1_KEYS.values()) + list(PLAYER2_KEYS.values()))
+                return [pygame.event.Event(pygame.KEYDOWN, key=key)]
+            return []
+        events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(rng.randrange(1140), rng.randrange(770)))]
+        if rng.random() < 0.05:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+        return events
+    return get
+
+
+def create_game(game_name):
+    player1, player2 = Player("al"), Player("bo")
+    player1.score = 50
+    if game_name == "tetris":
+        from src.games.tetris import TetrisGame
+        return TetrisGame(player1, player2), {}
+    from src.games.suika import SuikaGame
+    options = {"two_player": True}
+    return SuikaGame(player1, player2, **options), options
+
+
+def snapshot(game):
+    """What the boards look like, to check a replay ends in the same position and not just the same score."""
+    if game.name == "tetris":
+        return game.board1, game.board2, game.drop_timer1, game.drop_timer2
+    fruit = [sorted((particle.n, tuple(particle.body.position)) for particle in board.particles)
+             for board in game.boards]
+    return fruit, game.accumulator
+
+
+@pytest.mark.parametrize("game_name", ["tetris", "suika"])
+def test_game_scene_replay_round_trip(game_name, tmp_path, monkeypatch, display):
+    game, options = create_game(game_name)
+    filename = str(tmp_path / f"{game_name}.tmr")
+    recorder = ReplayRecorder(filename, game, GameScene.fps, options)
+    monkeypatch.setattr(pygame.time, "Clock", FakeClock)
+    monkeypatch.setattr(pygame.event, "get", scripted_input(game_name, 600))
+
+    screen_manager = ScreenManager()
+    screen_manager.push(GameScene(screen_manager, game, recorder))
+    screen_manager.run()
+
+    player = ReplayPlayer(filename)
+    assert player.frames == game.frame
+    replayed = player.play()
+    assert replayed.frame == game.frame
+    assert snapshot(replayed) == snapshot(game)
+    assert replayed.get_scores() == game.get_scores() == player.final_scores
+
+
+@pytest.mark.parametrize("game_name", ["tetris", "suika"])
+def test_game_loop_replay_round_trip(game_name, tmp_path, monkeypatch, display):
+    game, options = create_game(game_name)
+    filename = str(tmp_path / f"{game_name}.tmr")
+    recorder = ReplayRecorder(filename, game, 60, options)
+    monkeypatch.setattr(pygame.event, "get", scripted_input(game_name, 600))
+
+    game.run_game_loop(pygame.display.set_mode(game.display_size), FakeClock(), 60, recorder)
+
+    player = ReplayPlayer(filename)
+    assert player.frames == game.frame
+    replayed = player.play()
+    assert snapshot(replayed) == snapshot(game)
+    assert replayed.get_scores() == game.get_scores() == player.final_scores
+
+
+def test_frame_times_read_back_exactly(tmp_path, display):
+    game, _ = create_game("tetris")
+    rng = random.Random(5)
+    times = [rng.choice([16, 17, 17, 17, 16, 50, 0, 40000]) for _ in range(3000)]
+    times[1000:1200] = [17] * 200  # A steady stretch, stored as one long run
+    filename = str(tmp_path / "times.tmr")
+    recorder = ReplayRecorder(filename, game, 60)
+    for frame, frame_ms in enumerate(times):
+        recorder.record_frame_time(frame, frame_ms)
+    game.frame = len(times)
+    recorder.finish(game)
+
+    frame_times = ReplayPlayer(filename).frame_times
+    assert [frame_times[frame] for frame in range(len(times))] == times